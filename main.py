@@ -13,8 +13,10 @@ Created with GitHub Copilot
 # Import necessary modules for Flask application, environment variable handling, and HTTP requests
 import os
 import logging
-from flask import Flask
+from flask import Flask, Response, abort
+from flask_compress import Compress
 from dotenv import load_dotenv
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 # Import blueprints
 from routes.forecast import forecast_bp
@@ -35,6 +37,17 @@ logger = logging.getLogger(__name__)
 # Initialize the Flask application
 app = Flask(__name__)
 
+# Compress HTML and JSON responses; forecast payloads are large and highly repetitive.
+# Streaming chat responses (text/event-stream) are deliberately left uncompressed.
+app.config.update(
+    COMPRESS_MIMETYPES=['text/html', 'application/json'],
+    COMPRESS_ALGORITHM=['br', 'gzip'],
+    COMPRESS_LEVEL=4,
+    COMPRESS_BR_LEVEL=4,
+    COMPRESS_MIN_SIZE=512
+)
+Compress(app)
+
 # Template filters for better date formatting
 @app.template_filter('format_date')
 def format_date_filter(date_string):
@@ -69,6 +82,16 @@ app.add_url_rule('/api/search-locations', 'search_locations', search_locations,
 app.add_url_rule('/api/detailed-forecast', 'detailed_forecast', get_detailed_forecast, methods=['GET'])
 app.add_url_rule('/api/hourly-forecast', 'hourly_forecast', get_hourly_forecast, methods=['GET'])
 
+
+# Prometheus metrics endpoint (cache hit/miss counts, upstream latency)
+@app.route('/metrics')
+def metrics():
+    """Returns Prometheus metrics; not found unless WEATHER_METRICS_ENABLED is set"""
+    if os.getenv('WEATHER_METRICS_ENABLED', 'false').lower() != 'true':
+        abort(404)
+    return Response(generate_latest(), mimetype=CONTENT_TYPE_LATEST)
+
+
 # Context processor to inject debug_mode into all templates
 @app.context_processor
 def inject_debug_mode():
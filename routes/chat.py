@@ -7,9 +7,10 @@ for GPT-powered weather assistant functionality.
 
 from flask import Blueprint, request, jsonify, Response, stream_with_context
 import os
-import json
 import logging
+from functools import lru_cache
 from typing import Generator
+import orjson
 from openai import AzureOpenAI
 
 # Configure logging for chat module
@@ -47,19 +48,7 @@ def get_deployment_name():
     return os.getenv('AZURE_OPENAI_DEPLOYMENT', '')
 
 
-def build_system_prompt(context: dict) -> str:
-    """
-    Build a blended system prompt for the weather assistant.
-    
-    Combines weather-specific knowledge with general chat capabilities.
-    
-    Args:
-        context: Dictionary containing current weather data and recent locations
-        
-    Returns:
-        System prompt string
-    """
-    base_prompt = """You are a helpful weather assistant with expertise in meteorology and weather patterns. 
+_BASE_SYSTEM_PROMPT = """You are a helpful weather assistant with expertise in meteorology and weather patterns. 
 Your role is to help users understand weather conditions, forecasts, and provide insights about the weather 
 in their searched locations.
 
@@ -76,32 +65,103 @@ Guidelines:
 - Be concise but thorough in your explanations
 - Use a friendly, conversational tone"""
 
-    # Add current weather context (the location the user is viewing)
+
+def _prompt_facts(context: dict) -> tuple:
+    """
+    Extract every context value the system prompt uses, as a nested tuple.
+    
+    The tuple fully determines the prompt, so it doubles as the cache key
+    for _render_system_prompt.
+    """
+    weather_facts = None
     if context and context.get('currentWeather'):
         cw = context['currentWeather']
         loc = cw.get('location', {})
         current = cw.get('current', {})
         
-        location_name = loc.get('name', 'Unknown')
-        region = loc.get('region', '')
-        country = loc.get('country', '')
-        full_location = ', '.join(filter(None, [location_name, region, country]))
+        full_location = ', '.join(filter(None, [
+            loc.get('name', 'Unknown'), loc.get('region', ''), loc.get('country', '')
+        ]))
+        
+        current_facts = None
+        if current:
+            current_facts = (
+                current.get('condition', {}).get('text', 'N/A'),
+                current.get('temp_c', 'N/A'),
+                current.get('temp_f', 'N/A'),
+                current.get('feelslike_c', 'N/A'),
+                current.get('feelslike_f', 'N/A'),
+                current.get('humidity', 'N/A'),
+                current.get('wind_kph', 'N/A'),
+                current.get('wind_mph', 'N/A'),
+                current.get('vis_km', 'N/A'),
+                current.get('pressure_mb', 'N/A'),
+                current.get('uv', 'N/A')
+            )
+        
+        uv_facts = None
+        if cw.get('uv_info'):
+            uv_info = cw['uv_info']
+            uv_facts = (uv_info.get('level', 'N/A'), uv_info.get('recommendation', ''))
+        
+        aqi_facts = None
+        if cw.get('aqi_info'):
+            aqi = cw['aqi_info']
+            aqi_facts = (aqi.get('level', 'N/A'), aqi.get('pm2_5'), aqi.get('guidance', ''))
+        
+        alerts = tuple(
+            (alert.get('headline', 'Weather Alert'), alert.get('severity', 'Unknown severity'))
+            for alert in (cw.get('alerts') or [])[:3]  # Limit to 3 alerts
+        )
+        
+        forecast_days = ()
+        forecast = cw.get('forecast', {})
+        if forecast and forecast.get('forecastday'):
+            forecast_days = tuple(
+                (
+                    day.get('date', 'N/A'),
+                    day.get('day', {}).get('condition', {}).get('text', 'N/A'),
+                    day.get('day', {}).get('maxtemp_c', 'N/A'),
+                    day.get('day', {}).get('mintemp_c', 'N/A'),
+                    day.get('day', {}).get('daily_chance_of_rain', 0)
+                )
+                for day in forecast['forecastday'][:5]  # First 5 days
+            )
+        
+        weather_facts = (full_location, current_facts, uv_facts, aqi_facts, alerts, forecast_days)
+    
+    other_facts = ()
+    if context and context.get('locations'):
+        other_locations = [loc for loc in context['locations'] 
+                          if loc.get('location') != context.get('currentLocation')]
+        other_facts = tuple(
+            (
+                loc_info.get('displayName', loc_info.get('location', 'Unknown')),
+                loc_info.get('weather', {}).get('current', {}).get('temp_c', 'N/A'),
+                loc_info.get('weather', {}).get('current', {}).get('condition', {}).get('text', 'N/A')
+            ) if loc_info.get('weather', {}).get('current') else None
+            for loc_info in other_locations[:3]
+        )
+    
+    return weather_facts, other_facts
+
+
+@lru_cache(maxsize=64)
+def _render_system_prompt(facts: tuple) -> str:
+    """Format the system prompt from the tuple built by _prompt_facts."""
+    weather_facts, other_facts = facts
+    base_prompt = _BASE_SYSTEM_PROMPT
+
+    # Add current weather context (the location the user is viewing)
+    if weather_facts:
+        full_location, current_facts, uv_facts, aqi_facts, alerts, forecast_days = weather_facts
         
         base_prompt += f"\n\n=== CURRENTLY DISPLAYED WEATHER ===\n"
         base_prompt += f"Location: {full_location}\n"
         
-        if current:
-            condition = current.get('condition', {}).get('text', 'N/A')
-            temp_c = current.get('temp_c', 'N/A')
-            temp_f = current.get('temp_f', 'N/A')
-            feels_c = current.get('feelslike_c', 'N/A')
-            feels_f = current.get('feelslike_f', 'N/A')
-            humidity = current.get('humidity', 'N/A')
-            wind_kph = current.get('wind_kph', 'N/A')
-            wind_mph = current.get('wind_mph', 'N/A')
-            vis_km = current.get('vis_km', 'N/A')
-            pressure = current.get('pressure_mb', 'N/A')
-            uv = current.get('uv', 'N/A')
+        if current_facts:
+            (condition, temp_c, temp_f, feels_c, feels_f, humidity,
+             wind_kph, wind_mph, vis_km, pressure, uv) = current_facts
             
             base_prompt += f"Condition: {condition}\n"
             base_prompt += f"Temperature: {temp_c}°C ({temp_f}°F)\n"
@@ -113,58 +173,66 @@ Guidelines:
             base_prompt += f"UV Index: {uv}\n"
         
         # Add UV safety info if available
-        if cw.get('uv_info'):
-            uv_info = cw['uv_info']
-            base_prompt += f"\nUV Safety: {uv_info.get('level', 'N/A')} - {uv_info.get('recommendation', '')}\n"
+        if uv_facts:
+            level, recommendation = uv_facts
+            base_prompt += f"\nUV Safety: {level} - {recommendation}\n"
         
         # Add air quality info if available
-        if cw.get('aqi_info'):
-            aqi = cw['aqi_info']
-            base_prompt += f"\nAir Quality: {aqi.get('level', 'N/A')}"
-            if aqi.get('pm2_5'):
-                base_prompt += f" (PM2.5: {aqi['pm2_5']} µg/m³)"
-            base_prompt += f"\nAir Quality Guidance: {aqi.get('guidance', '')}\n"
+        if aqi_facts:
+            level, pm2_5, guidance = aqi_facts
+            base_prompt += f"\nAir Quality: {level}"
+            if pm2_5:
+                base_prompt += f" (PM2.5: {pm2_5} µg/m³)"
+            base_prompt += f"\nAir Quality Guidance: {guidance}\n"
         
         # Add weather alerts if any
-        if cw.get('alerts') and len(cw['alerts']) > 0:
+        if alerts:
             base_prompt += f"\n⚠️ ACTIVE WEATHER ALERTS:\n"
-            for alert in cw['alerts'][:3]:  # Limit to 3 alerts
-                base_prompt += f"- {alert.get('headline', 'Weather Alert')}: {alert.get('severity', 'Unknown severity')}\n"
+            for headline, severity in alerts:
+                base_prompt += f"- {headline}: {severity}\n"
         
         # Add forecast summary
-        forecast = cw.get('forecast', {})
-        if forecast and forecast.get('forecastday'):
+        if forecast_days:
             base_prompt += f"\n10-Day Forecast Summary:\n"
-            for day in forecast['forecastday'][:5]:  # First 5 days
-                date = day.get('date', 'N/A')
-                day_data = day.get('day', {})
-                max_c = day_data.get('maxtemp_c', 'N/A')
-                min_c = day_data.get('mintemp_c', 'N/A')
-                cond = day_data.get('condition', {}).get('text', 'N/A')
-                rain_chance = day_data.get('daily_chance_of_rain', 0)
+            for date, cond, max_c, min_c, rain_chance in forecast_days:
                 base_prompt += f"- {date}: {cond}, High {max_c}°C, Low {min_c}°C"
                 if rain_chance > 0:
                     base_prompt += f", {rain_chance}% chance of rain"
                 base_prompt += "\n"
 
     # Also add other recent locations for context
-    if context and context.get('locations'):
-        other_locations = [loc for loc in context['locations'] 
-                          if loc.get('location') != context.get('currentLocation')]
-        if other_locations:
-            base_prompt += "\n\nOther recently searched locations:\n"
-            for loc_info in other_locations[:3]:
-                location = loc_info.get('displayName', loc_info.get('location', 'Unknown'))
-                weather = loc_info.get('weather', {})
-                current = weather.get('current', {})
-                if current:
-                    temp = current.get('temp_c', 'N/A')
-                    condition = current.get('condition', {}).get('text', 'N/A')
-                    base_prompt += f"- {location}: {temp}°C, {condition}\n"
+    if other_facts:
+        base_prompt += "\n\nOther recently searched locations:\n"
+        for location_facts in other_facts:
+            if location_facts:
+                location, temp, condition = location_facts
+                base_prompt += f"- {location}: {temp}°C, {condition}\n"
 
     return base_prompt
 
 
+def build_system_prompt(context: dict) -> str:
+    """
+    Build a blended system prompt for the weather assistant.
+    
+    Combines weather-specific knowledge with general chat capabilities.
+    Consecutive chat turns usually send the same weather context, so the
+    formatted prompt is cached by the context values it uses.
+    
+    Args:
+        context: Dictionary containing current weather data and recent locations
+        
+    Returns:
+        System prompt string
+    """
+    facts = _prompt_facts(context)
+    try:
+        return _render_system_prompt(facts)
+    except TypeError:
+        # Unhashable value in the context (e.g. a nested object); build uncached
+        return _render_system_prompt.__wrapped__(facts)
+
+
 def stream_azure_response(message: str, context: dict) -> Generator[str, None, None]:
     """
     Stream response from Azure OpenAI.
@@ -219,7 +287,8 @@ def stream_azure_response(message: str, context: dict) -> Generator[str, None, N
             if chunk.choices and len(chunk.choices) > 0:
                 delta = chunk.choices[0].delta
                 if delta and delta.content:
-                    yield f'data: {{"content": {json.dumps(delta.content)}}}\n\n'
+                    # orjson keeps per-token SSE framing cheap on long replies
+                    yield f'data: {orjson.dumps({"content": delta.content}).decode()}\n\n'
 
         yield 'data: [DONE]\n\n'
         logger.info("Stream completed successfully")
@@ -227,7 +296,7 @@ def stream_azure_response(message: str, context: dict) -> Generator[str, None, N
     except Exception as e:
         error_msg = f"Azure OpenAI error: {str(e)}"
         logger.error(error_msg, exc_info=True)
-        yield f'data: {{"error": {json.dumps(error_msg)}}}\n\n'
+        yield f'data: {orjson.dumps({"error": error_msg}).decode()}\n\n'
         yield 'data: [DONE]\n\n'
 
 
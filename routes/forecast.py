@@ -5,7 +5,8 @@ This module handles all forecast-related routes, using the WeatherService
 abstraction for API calls.
 """
 
-from flask import Blueprint, request, jsonify, redirect
+from flask import Blueprint, Response, request, jsonify, redirect
+import orjson
 import os
 
 from services import WeatherAPIProvider
@@ -108,7 +109,9 @@ def search_locations():
 
     try:
         results = service.search_locations(query, limit=10)
-        return jsonify([r.to_dict() for r in results]), 200
+        # orjson serializes the SearchResult dataclasses directly, without
+        # building an intermediate dict per result
+        return Response(orjson.dumps(results), mimetype='application/json'), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
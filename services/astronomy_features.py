@@ -5,35 +5,71 @@ This module enriches weather data with astronomy information including
 sunrise, sunset, moonrise, moonset, moon phase with emojis, and daylight duration.
 """
 
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from datetime import datetime
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Iterator, List, Tuple, Union
 
 
-def get_moon_phase_emoji(phase: str) -> str:
+# Moon emojis in phase order, starting at new moon
+_MOON_EMOJI = ('🌑', '🌒', '🌓', '🌔', '🌕', '🌖', '🌗', '🌘')
+
+# Phase name -> emoji, keyed by casefolded name; built once at import
+_PHASE_EMOJI = MappingProxyType({
+    name.casefold(): emoji for name, emoji in {
+        "New Moon": "🌑",
+        "Waxing Crescent": "🌒",
+        "First Quarter": "🌓",
+        "Waxing Gibbous": "🌔",
+        "Full Moon": "🌕",
+        "Waning Gibbous": "🌖",
+        "Last Quarter": "🌗",
+        "Waning Crescent": "🌘",
+        "Third Quarter": "🌗",  # Alias for last quarter
+    }.items()
+})
+
+
+def get_moon_phase_emoji(phase: Union[str, float, None]) -> str:
     """
     Get emoji representation for moon phase.
     
     Args:
-        phase: Moon phase name (e.g., "New Moon", "First Quarter")
+        phase: Moon phase name (e.g., "New Moon", "First Quarter"), or the
+               phase as a fraction of the lunar cycle (0 = new, 0.5 = full)
     
     Returns:
         Emoji string representing the moon phase
     """
-    phase_lower = phase.lower() if phase else ""
-    
-    moon_phases = {
-        "new moon": "🌑",
-        "waxing crescent": "🌒",
-        "first quarter": "🌓",
-        "waxing gibbous": "🌔",
-        "full moon": "🌕",
-        "waning gibbous": "🌖",
-        "last quarter": "🌗",
-        "waning crescent": "🌘",
-        "third quarter": "🌗",  # Alias for last quarter
-    }
+    if isinstance(phase, (int, float)):
+        # Round to the nearest eighth of the cycle; & 7 wraps 1.0 back to new
+        return _MOON_EMOJI[int((phase + 0.0625) * 8) & 7]
     
-    return moon_phases.get(phase_lower, "🌙")
+    return _PHASE_EMOJI.get(phase.casefold() if phase else "", "🌙")
+
+
+def _clock_minutes(value: str) -> int:
+    """
+    Parse a 12-hour "HH:MM AM/PM" time into minutes since midnight.
+    
+    Raises:
+        ValueError: If the value is not a valid 12-hour time
+    """
+    # Surrounding whitespace and any run of spaces between the fields are accepted
+    parts = value.split()
+    if len(parts) != 2:
+        raise ValueError(f"Invalid 12-hour time: {value!r}")
+    clock, meridiem = parts
+    hours, separator, minutes = clock.partition(':')
+    meridiem = meridiem.upper()
+    if not separator or meridiem not in ('AM', 'PM'):
+        raise ValueError(f"Invalid 12-hour time: {value!r}")
+    
+    hour = int(hours)
+    minute = int(minutes)
+    if not (1 <= hour <= 12 and 0 <= minute <= 59):
+        raise ValueError(f"Invalid 12-hour time: {value!r}")
+    
+    return (hour % 12 + (12 if meridiem == 'PM' else 0)) * 60 + minute
 
 
 def calculate_daylight_duration(sunrise: str, sunset: str) -> Optional[str]:
@@ -51,25 +87,16 @@ def calculate_daylight_duration(sunrise: str, sunset: str) -> Optional[str]:
         return None
     
     try:
-        # Parse 12-hour format times
-        sunrise_time = datetime.strptime(sunrise, "%I:%M %p")
-        sunset_time = datetime.strptime(sunset, "%I:%M %p")
-        
-        # Calculate duration
-        duration = sunset_time - sunrise_time
-        
-        # Handle cases where sunset is "before" sunrise (crosses midnight)
-        if duration.total_seconds() < 0:
-            duration = timedelta(days=1) + duration
-        
-        # Convert to hours and minutes
-        total_seconds = int(duration.total_seconds())
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        
-        return f"{hours}h {minutes}m"
+        # Parsed by hand; datetime.strptime dominates the cost of this function
+        sunrise_minutes = _clock_minutes(sunrise)
+        sunset_minutes = _clock_minutes(sunset)
     except (ValueError, AttributeError):
         return None
+    
+    # Modulo handles sunset "before" sunrise (crosses midnight)
+    hours, minutes = divmod((sunset_minutes - sunrise_minutes) % 1440, 60)
+    
+    return f"{hours}h {minutes}m"
 
 
 def process_astronomy_day(day_data: Dict[str, Any], is_current_day: bool = False) -> Dict[str, Any]:
@@ -114,48 +141,54 @@ def process_astronomy_day(day_data: Dict[str, Any], is_current_day: bool = False
     }
 
 
-def get_astronomy_data(weather_data: Optional[Dict[str, Any]], include_current_day: bool = True) -> List[Dict[str, Any]]:
+def _iter_astronomy(weather_data: Optional[Dict[str, Any]]) -> Iterator[Tuple[bool, Dict[str, Any]]]:
     """
-    Extract and process astronomy data from weather forecast.
+    Process each forecast day's astronomy data, in forecast order.
+    
+    Days without a valid "YYYY-MM-DD" date are skipped.
     
     Args:
         weather_data: Weather data dictionary from API
-        include_current_day: Whether to include today in the results
     
-    Returns:
-        List of processed astronomy data dictionaries
+    Yields:
+        (is_current_day, processed astronomy dictionary) per forecast day
     """
     if not weather_data or 'forecast' not in weather_data:
-        return []
+        return
     
     forecast = weather_data['forecast']
-    if not forecast or 'forecastday' not in forecast:
-        return []
+    if not forecast:
+        return
     
-    forecastdays = forecast['forecastday']
-    if not forecastdays:
-        return []
-    
-    astronomy_data = []
     today = datetime.now().date()
     
-    for idx, day_data in enumerate(forecastdays):
+    for day_data in forecast.get('forecastday') or []:
         try:
             day_date = datetime.strptime(day_data.get('date', ''), '%Y-%m-%d').date()
             is_current_day = (day_date == today)
-            
-            # Skip current day if requested
-            if is_current_day and not include_current_day:
-                continue
-            
             processed = process_astronomy_day(day_data, is_current_day)
-            astronomy_data.append(processed)
-            
         except (ValueError, AttributeError):
             # Skip days with invalid date format
             continue
+        
+        yield is_current_day, processed
+
+
+def get_astronomy_data(weather_data: Optional[Dict[str, Any]], include_current_day: bool = True) -> List[Dict[str, Any]]:
+    """
+    Extract and process astronomy data from weather forecast.
+    
+    Args:
+        weather_data: Weather data dictionary from API
+        include_current_day: Whether to include today in the results
     
-    return astronomy_data
+    Returns:
+        List of processed astronomy data dictionaries
+    """
+    return [
+        processed for is_current_day, processed in _iter_astronomy(weather_data)
+        if include_current_day or not is_current_day
+    ]
 
 
 def enrich_with_astronomy(weather_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
@@ -164,6 +197,7 @@ def enrich_with_astronomy(weather_data: Optional[Dict[str, Any]]) -> Optional[Di
     
     Adds 'astronomy_info' field with current day astronomy and
     'astronomy_forecast' with 5-day forecast (excluding current day).
+    Data that has already been enriched is returned unchanged.
     
     Args:
         weather_data: Weather data dictionary from API
@@ -174,14 +208,25 @@ def enrich_with_astronomy(weather_data: Optional[Dict[str, Any]]) -> Optional[Di
     if not weather_data:
         return None
     
-    # Get current day astronomy
-    current_astronomy = get_astronomy_data(weather_data, include_current_day=True)
-    if current_astronomy:
-        weather_data['astronomy_info'] = current_astronomy[0]
-    
-    # Get multi-day astronomy forecast (excluding current day, next 5 days)
-    all_astronomy = get_astronomy_data(weather_data, include_current_day=False)
-    # Limit to next 5 days
-    weather_data['astronomy_forecast'] = all_astronomy[:5]
+    # Already enriched (e.g. a cached forecast dict served again)
+    if 'astronomy_forecast' in weather_data:
+        return weather_data
+    
+    # Single pass: the first processed day is the current-day summary, and
+    # later non-current days fill the multi-day forecast (next 5 days)
+    astronomy_info = None
+    astronomy_forecast = []
+    
+    for is_current_day, processed in _iter_astronomy(weather_data):
+        if astronomy_info is None:
+            astronomy_info = processed
+        if not is_current_day:
+            astronomy_forecast.append(processed)
+            if len(astronomy_forecast) == 5:
+                break
+    
+    if astronomy_info is not None:
+        weather_data['astronomy_info'] = astronomy_info
+    weather_data['astronomy_forecast'] = astronomy_forecast
     
     return weather_data
@@ -0,0 +1,61 @@
+"""
+Lightweight in-process cache for weather service responses.
+
+Entries expire a fixed number of seconds after they are stored and the least
+recently used entry is evicted when the cache is full. Expiry is checked
+lazily on lookup against time.monotonic(), so a cache hit costs one dict
+lookup and a clock read.
+"""
+
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Hashable
+
+
+class ExpiringCache:
+    """Size-bounded LRU cache with a per-entry time-to-live."""
+
+    __slots__ = ('_data', '_maxsize', '_ttl')
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self._data: OrderedDict = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for key, or default if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= monotonic():
+            self._data.pop(key, None)
+            return default
+
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            # Evicted by another thread since the lookup above
+            pass
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        data = self._data
+        data[key] = (monotonic() + self._ttl, value)
+        data.move_to_end(key)
+        while len(data) > self._maxsize:
+            try:
+                data.popitem(last=False)
+            except KeyError:
+                break
+
+    def __len__(self) -> int:
+        return len(self._data)
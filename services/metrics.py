@@ -0,0 +1,28 @@
+"""
+Prometheus metrics for the weather service layer.
+
+Counts cache hits/misses per cache and times upstream WeatherAPI calls per
+endpoint, so cache TTLs and slow endpoints can be tuned from real data.
+Exposed by the Flask app at /metrics.
+"""
+
+from prometheus_client import Counter, Histogram
+
+CACHE_HIT = Counter(
+    'wx_cache_hit',
+    'Weather service cache hits',
+    ['cache']
+)
+
+CACHE_MISS = Counter(
+    'wx_cache_miss',
+    'Weather service cache misses',
+    ['cache']
+)
+
+UPSTREAM_LATENCY = Histogram(
+    'wx_upstream_seconds',
+    'Latency of upstream WeatherAPI requests',
+    ['endpoint'],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5)
+)
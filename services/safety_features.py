@@ -8,9 +8,104 @@ Author: John Wildes
 License: Apache License 2.0
 """
 
+import math
+from types import MappingProxyType
 from typing import Optional, Dict, List, Any
 
 
+# UV index classification (WHO). Each level's constant fields are built once
+# at import; get_uv_info only adds the measured value.
+_UV_LOW = MappingProxyType({
+    'level': "Low",
+    'color': "#1e7b34",  # Green (dark)
+    'recommendation': "Minimal protection needed. Wear sunglasses on bright days.",
+    'icon': "🟢"
+})
+_UV_MODERATE = MappingProxyType({
+    'level': "Moderate",
+    'color': "#b8860b",  # Yellow (dark)
+    'recommendation': "Protection required. Wear sunscreen SPF 30+, hat, and sunglasses.",
+    'icon': "🟡"
+})
+_UV_HIGH = MappingProxyType({
+    'level': "High",
+    'color': "#c65102",  # Orange (dark)
+    'recommendation': "Protection essential. Seek shade during midday. Sunscreen, hat, and sunglasses required.",
+    'icon': "🟠"
+})
+_UV_VERY_HIGH = MappingProxyType({
+    'level': "Very High",
+    'color': "#a31621",  # Red (dark)
+    'recommendation': "Extra protection required. Avoid sun 10am-4pm. Sunscreen SPF 50+, protective clothing required.",
+    'icon': "🔴"
+})
+_UV_EXTREME = MappingProxyType({
+    'level': "Extreme",
+    'color': "#5a3d8a",  # Purple (dark)
+    'recommendation': "Take all precautions. Avoid sun exposure. Unprotected skin can burn in minutes.",
+    'icon': "🟣"
+})
+
+# Indexed by ceil(uv), clamped to 0..11 (0-2 Low, 3-5 Moderate, 6-7 High, 8-10 Very High, 11+ Extreme)
+_UV_TABLE = (
+    (_UV_LOW,) * 3
+    + (_UV_MODERATE,) * 3
+    + (_UV_HIGH,) * 2
+    + (_UV_VERY_HIGH,) * 3
+    + (_UV_EXTREME,)
+)
+
+# US EPA AQI classification, indexed by EPA index 1-6. Like the UV levels, only
+# the measured value and particulate readings are added per call.
+_AQI_TABLE = (
+    None,
+    MappingProxyType({
+        'level': "Good",
+        'color': "#1e7b34",  # Green (dark)
+        'guidance': "Air quality is satisfactory. Air pollution poses little or no risk.",
+        'icon': "🟢"
+    }),
+    MappingProxyType({
+        'level': "Moderate",
+        'color': "#b8860b",  # Yellow (dark)
+        'guidance': "Acceptable air quality. Unusually sensitive people should consider limiting prolonged outdoor exertion.",
+        'icon': "🟡"
+    }),
+    MappingProxyType({
+        'level': "Unhealthy for Sensitive Groups",
+        'color': "#c65102",  # Orange (dark)
+        'guidance': "People with respiratory or heart conditions, elderly, and children should limit prolonged outdoor exertion.",
+        'icon': "🟠"
+    }),
+    MappingProxyType({
+        'level': "Unhealthy",
+        'color': "#a31621",  # Red (dark)
+        'guidance': "Everyone may begin to experience health effects. Sensitive groups should avoid prolonged outdoor exertion.",
+        'icon': "🔴"
+    }),
+    MappingProxyType({
+        'level': "Very Unhealthy",
+        'color': "#5a3d8a",  # Purple (dark)
+        'guidance': "Health alert. Everyone should avoid prolonged outdoor exertion. Sensitive groups should avoid all outdoor activity.",
+        'icon': "🟣"
+    }),
+    MappingProxyType({
+        'level': "Hazardous",
+        'color': "#5c0019",  # Maroon (dark)
+        'guidance': "Health warning of emergency conditions. Everyone should avoid all outdoor exertion.",
+        'icon': "🟤"
+    }),
+)
+
+# Alert severity -> (color, icon), using standard dark colors
+_SEVERITY_STYLES = {
+    'extreme': ("#a31621", "🔴"),   # Red (dark)
+    'severe': ("#c65102", "🟠"),    # Orange (dark)
+    'moderate': ("#b8860b", "🟡"),  # Yellow (dark)
+}
+_DEFAULT_SEVERITY_STYLE = ("#1e7b34", "🟢")  # Green (dark)
+
+
 def get_uv_info(current_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Extract and classify UV index information.
@@ -23,38 +118,9 @@ def get_uv_info(current_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     uv_value = current_data.get('uv', 0)
     
-    if uv_value <= 2:
-        level = "Low"
-        color = "#1e7b34"  # Green (dark)
-        recommendation = "Minimal protection needed. Wear sunglasses on bright days."
-        icon = "🟢"
-    elif uv_value <= 5:
-        level = "Moderate"
-        color = "#b8860b"  # Yellow (dark)
-        recommendation = "Protection required. Wear sunscreen SPF 30+, hat, and sunglasses."
-        icon = "🟡"
-    elif uv_value <= 7:
-        level = "High"
-        color = "#c65102"  # Orange (dark)
-        recommendation = "Protection essential. Seek shade during midday. Sunscreen, hat, and sunglasses required."
-        icon = "🟠"
-    elif uv_value <= 10:
-        level = "Very High"
-        color = "#a31621"  # Red (dark)
-        recommendation = "Extra protection required. Avoid sun 10am-4pm. Sunscreen SPF 50+, protective clothing required."
-        icon = "🔴"
-    else:  # 11+
-        level = "Extreme"
-        color = "#5a3d8a"  # Purple (dark)
-        recommendation = "Take all precautions. Avoid sun exposure. Unprotected skin can burn in minutes."
-        icon = "🟣"
-    
     return {
         'value': uv_value,
-        'level': level,
-        'color': color,
-        'recommendation': recommendation,
-        'icon': icon
+        **_UV_TABLE[min(max(math.ceil(uv_value), 0), 11)]
     }
 
 
@@ -76,50 +142,12 @@ def get_aqi_info(current_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     if aqi_value == 0:
         return None
     
-    # Extract PM values once
-    pm25 = air_quality.get('pm2_5', 0)
-    pm10 = air_quality.get('pm10', 0)
-    
-    # EPA AQI levels (1-6)
-    if aqi_value == 1:
-        level = "Good"
-        color = "#1e7b34"  # Green (dark)
-        guidance = "Air quality is satisfactory. Air pollution poses little or no risk."
-        icon = "🟢"
-    elif aqi_value == 2:
-        level = "Moderate"
-        color = "#b8860b"  # Yellow (dark)
-        guidance = "Acceptable air quality. Unusually sensitive people should consider limiting prolonged outdoor exertion."
-        icon = "🟡"
-    elif aqi_value == 3:
-        level = "Unhealthy for Sensitive Groups"
-        color = "#c65102"  # Orange (dark)
-        guidance = "People with respiratory or heart conditions, elderly, and children should limit prolonged outdoor exertion."
-        icon = "🟠"
-    elif aqi_value == 4:
-        level = "Unhealthy"
-        color = "#a31621"  # Red (dark)
-        guidance = "Everyone may begin to experience health effects. Sensitive groups should avoid prolonged outdoor exertion."
-        icon = "🔴"
-    elif aqi_value == 5:
-        level = "Very Unhealthy"
-        color = "#5a3d8a"  # Purple (dark)
-        guidance = "Health alert. Everyone should avoid prolonged outdoor exertion. Sensitive groups should avoid all outdoor activity."
-        icon = "🟣"
-    else:  # 6
-        level = "Hazardous"
-        color = "#5c0019"  # Maroon (dark)
-        guidance = "Health warning of emergency conditions. Everyone should avoid all outdoor exertion."
-        icon = "🟤"
-    
+    # EPA AQI levels (1-6); anything outside 1-5 is treated as Hazardous
     return {
         'value': aqi_value,
-        'level': level,
-        'color': color,
-        'guidance': guidance,
-        'icon': icon,
-        'pm2_5': pm25,
-        'pm10': pm10
+        **_AQI_TABLE[int(aqi_value) if 1 <= aqi_value <= 5 else 6],
+        'pm2_5': air_quality.get('pm2_5', 0),
+        'pm10': air_quality.get('pm10', 0)
     }
 
 
@@ -141,31 +169,20 @@ def get_alerts_info(alerts_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     formatted_alerts = []
     
     for alert in alert_list:
-        # Determine severity color (using standard dark colors)
-        severity = alert.get('severity', '').lower()
-        if severity == 'extreme':
-            color = "#a31621"  # Red (dark)
-            icon = "🔴"
-        elif severity == 'severe':
-            color = "#c65102"  # Orange (dark)
-            icon = "🟠"
-        elif severity == 'moderate':
-            color = "#b8860b"  # Yellow (dark)
-            icon = "🟡"
-        else:
-            color = "#1e7b34"  # Green (dark)
-            icon = "🟢"
+        get = alert.get
+        severity = get('severity', '').lower()
+        color, icon = _SEVERITY_STYLES.get(severity, _DEFAULT_SEVERITY_STYLE)
         
         formatted_alerts.append({
-            'headline': alert.get('headline', 'Weather Alert'),
-            'event': alert.get('event', ''),
+            'headline': get('headline', 'Weather Alert'),
+            'event': get('event', ''),
             'severity': severity.title(),
-            'urgency': alert.get('urgency', '').title(),
-            'areas': alert.get('areas', ''),
-            'description': alert.get('desc', ''),
-            'instruction': alert.get('instruction', ''),
-            'effective': alert.get('effective', ''),
-            'expires': alert.get('expires', ''),
+            'urgency': get('urgency', '').title(),
+            'areas': get('areas', ''),
+            'description': get('desc', ''),
+            'instruction': get('instruction', ''),
+            'effective': get('effective', ''),
+            'expires': get('expires', ''),
             'color': color,
             'icon': icon
         })
@@ -189,9 +206,10 @@ def enrich_weather_data(weather_data: Dict[str, Any]) -> Dict[str, Any]:
     current = weather_data.get('current', {})
     alerts = weather_data.get('alerts', {})
     
-    # Add safety features
+    # Add safety features; missing AQI and alert sections skip their
+    # extractor but keep their key so templates can test it directly
     weather_data['uv_info'] = get_uv_info(current)
-    weather_data['aqi_info'] = get_aqi_info(current)
-    weather_data['alerts_info'] = get_alerts_info(alerts)
+    weather_data['aqi_info'] = get_aqi_info(current) if current.get('air_quality') else None
+    weather_data['alerts_info'] = get_alerts_info(alerts) if alerts.get('alert') else []
     
     return weather_data
@@ -31,7 +31,7 @@ class APIRequestError(WeatherServiceError):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class LocationInfo:
     """Standardized location information."""
     name: str
@@ -66,7 +66,7 @@ class LocationInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Standardized location search result."""
     name: str
@@ -76,6 +76,10 @@ class SearchResult:
     value: str
 
     def to_dict(self) -> dict:
+        """
+        Deprecated: kept for backward compatibility. JSON responses serialize
+        SearchResult directly with orjson instead.
+        """
         return {
             'name': self.name,
             'region': self.region,
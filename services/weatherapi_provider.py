@@ -7,10 +7,14 @@ Includes server-side caching to reduce API calls and improve response times.
 """
 
 import os
+import orjson
 import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
-from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .weather_service import (
     WeatherService,
@@ -20,6 +24,16 @@ from .weather_service import (
     APIRequestError,
     SearchResult
 )
+from .cache import ExpiringCache
+from .metrics import CACHE_HIT, CACHE_MISS, UPSTREAM_LATENCY
+
+# HTTP configuration
+# (connect, read) timeouts in seconds for every upstream request
+REQUEST_TIMEOUT = (3, 10)
+# Keep-alive connection pool shared by all requests from this provider
+HTTP_POOL_SIZE = 20
+# Retry transient upstream failures with a short backoff
+HTTP_RETRIES = Retry(total=2, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
 
 # Cache configuration
 # Weather data caches (5-minute TTL for frequently changing data)
@@ -30,10 +44,28 @@ WEATHER_CACHE_MAXSIZE = 100
 LOCATION_CACHE_TTL = 3600  # 1 hour
 LOCATION_CACHE_MAXSIZE = 200
 
+# Locations the API reported as not found (short TTL so new queries recover quickly)
+INVALID_LOCATION_CACHE_TTL = 30
+INVALID_LOCATION_CACHE_MAXSIZE = 200
+
 # Search cache (10-minute TTL)
 SEARCH_CACHE_TTL = 600  # 10 minutes
 SEARCH_CACHE_MAXSIZE = 100
 
+# The detailed forecast always requests this many days (the API maximum), so
+# requests for fewer days and the home page can slice its cached response
+FORECAST_MAX_DAYS = 10
+
+# Days of forecast shown with current conditions on the home page; requested
+# on their own unless a full-length forecast is already cached
+SUMMARY_FORECAST_DAYS = 3
+
+# Maximum concurrent location fetches for bulk weather requests
+BULK_MAX_WORKERS = 8
+
+# Maximum concurrent history.json requests per location
+HISTORY_MAX_WORKERS = 7
+
 
 class WeatherAPIProvider(WeatherService):
     """
@@ -55,39 +87,73 @@ class WeatherAPIProvider(WeatherService):
         """
         self._api_key = api_key or os.getenv('WEATHER_API_KEY')
 
+        # Reuse connections across requests (and threads) instead of a new
+        # TCP handshake per call
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=HTTP_RETRIES
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        # Bulk workers each run their own history pool; this caps the
+        # requests in flight across all threads at the connection pool size
+        self._upstream_slots = threading.BoundedSemaphore(HTTP_POOL_SIZE)
+
         # Initialize caches
-        self._weather_cache = TTLCache(maxsize=WEATHER_CACHE_MAXSIZE, ttl=WEATHER_CACHE_TTL)
-        self._forecast_cache = TTLCache(maxsize=WEATHER_CACHE_MAXSIZE, ttl=WEATHER_CACHE_TTL)
-        self._location_cache = TTLCache(maxsize=LOCATION_CACHE_MAXSIZE, ttl=LOCATION_CACHE_TTL)
-        self._search_cache = TTLCache(maxsize=SEARCH_CACHE_MAXSIZE, ttl=SEARCH_CACHE_TTL)
-        self._hourly_cache = TTLCache(maxsize=WEATHER_CACHE_MAXSIZE, ttl=WEATHER_CACHE_TTL)
-        self._current_cache = TTLCache(maxsize=WEATHER_CACHE_MAXSIZE, ttl=WEATHER_CACHE_TTL)
+        self._weather_cache = ExpiringCache(maxsize=WEATHER_CACHE_MAXSIZE, ttl=WEATHER_CACHE_TTL)
+        self._forecast_cache = ExpiringCache(maxsize=WEATHER_CACHE_MAXSIZE, ttl=WEATHER_CACHE_TTL)
+        self._raw_forecast_cache = ExpiringCache(maxsize=WEATHER_CACHE_MAXSIZE, ttl=WEATHER_CACHE_TTL)
+        self._location_cache = ExpiringCache(maxsize=LOCATION_CACHE_MAXSIZE, ttl=LOCATION_CACHE_TTL)
+        self._invalid_location_cache = ExpiringCache(
+            maxsize=INVALID_LOCATION_CACHE_MAXSIZE, ttl=INVALID_LOCATION_CACHE_TTL
+        )
+        self._search_cache = ExpiringCache(maxsize=SEARCH_CACHE_MAXSIZE, ttl=SEARCH_CACHE_TTL)
+        self._hourly_cache = ExpiringCache(maxsize=WEATHER_CACHE_MAXSIZE, ttl=WEATHER_CACHE_TTL)
+        self._current_cache = ExpiringCache(maxsize=WEATHER_CACHE_MAXSIZE, ttl=WEATHER_CACHE_TTL)
+
+        # history.json date ranges (end_dt) are not available on every plan;
+        # switched off after the API rejects one
+        self._history_range_supported = True
 
     @staticmethod
-    def _cache_key(*args) -> str:
+    def _cache_key(*args) -> tuple:
         """
         Generate a cache key from arguments.
 
         - String arguments are normalized to be case- and whitespace-insensitive
           (e.g. " New York " and "new york" share the same cache key segment).
-        - Non-string arguments (such as numeric limits) are converted to their
-          string representation without additional normalization so that
+        - Non-string arguments (such as numeric limits) are kept as-is so that
           different values remain distinct.
-        - The current WEATHER_API_KEY value is prefixed into the cache key to
+        - The current WEATHER_API_KEY value is the first element of the key to
           avoid cross-key cache pollution if multiple API keys are ever used
           within the same process.
+
+        The key is a tuple rather than a joined string, so building it needs
+        no string concatenation and the caches hash its parts directly.
         """
         api_key = os.getenv("WEATHER_API_KEY", "").strip()
-        normalized_args = []
-        for arg in args:
-            if isinstance(arg, str):
-                normalized_args.append(arg.lower().strip())
-            else:
-                normalized_args.append(str(arg))
-        # Prefix with API key so different keys do not share cached entries.
-        if api_key:
-            return f"{api_key}:" + ":".join(normalized_args)
-        return ":".join(normalized_args)
+        return (api_key, *(
+            arg.lower().strip() if isinstance(arg, str) else arg
+            for arg in args
+        ))
+
+    @staticmethod
+    def _cache_lookup(cache: ExpiringCache, name: str, cache_key: tuple):
+        """
+        Look up a cache entry, recording a hit or miss for the named cache.
+
+        Returns:
+            The cached value, or None if the key is not cached
+        """
+        result = cache.get(cache_key)
+        if result is None:
+            CACHE_MISS.labels(name).inc()
+        else:
+            CACHE_HIT.labels(name).inc()
+        return result
+
     @property
     def api_key(self) -> str:
         """Get the API key, raising an error if not configured."""
@@ -110,20 +176,64 @@ class WeatherAPIProvider(WeatherService):
             APIKeyMissingError: If API key is not configured
             APIRequestError: If the request fails
         """
-        params['key'] = self.api_key
+        # Copy rather than mutate the caller's params; requests may run on worker threads
+        params = {**params, 'key': self.api_key}
         url = f"{self.BASE_URL}/{endpoint}"
 
         try:
-            response = requests.get(url, params=params)
+            with self._upstream_slots, UPSTREAM_LATENCY.labels(endpoint).time():
+                response = self._session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+        except requests.exceptions.RequestException as e:
+            raise APIRequestError(f"Request failed: {e}")
+
+        if response.status_code == 400:
+            # Location not found or invalid query. Checked before
+            # raise_for_status so typos in search don't raise and unwind.
+            return None
+
+        try:
             response.raise_for_status()
-            return response.json()
+            # orjson parses the large forecast payloads several times faster
+            # than the stdlib json used by response.json()
+            return orjson.loads(response.content)
         except requests.exceptions.HTTPError as e:
-            if response.status_code == 400:
-                # Location not found or invalid query
-                return None
             raise APIRequestError(f"HTTP error: {e}")
-        except requests.exceptions.RequestException as e:
-            raise APIRequestError(f"Request failed: {e}")
+        except orjson.JSONDecodeError as e:
+            raise APIRequestError(f"Invalid JSON response: {e}")
+
+    def _fetch_forecast(self, location: str, max_days: int = FORECAST_MAX_DAYS) -> Optional[dict]:
+        """
+        Get the raw forecast.json response (with air quality and alerts).
+
+        Used by get_weather_data and get_detailed_forecast, which slice the
+        forecast days they need from the cached response.
+
+        Args:
+            location: Location query
+            max_days: Number of forecast days to request
+
+        Returns:
+            Raw API response, or None if the location is invalid
+
+        Raises:
+            WeatherServiceError: If the request fails
+        """
+        cache_key = self._cache_key('forecast', location, max_days)
+
+        cached = self._cache_lookup(self._raw_forecast_cache, 'forecast', cache_key)
+        if cached is not None:
+            return cached
+
+        data = self._make_request('forecast.json', {
+            'q': location,
+            'days': max_days,
+            'aqi': 'yes',
+            'alerts': 'yes'
+        })
+
+        if data:
+            self._raw_forecast_cache[cache_key] = data
+        return data
 
     def get_weather_data(self, location: str) -> Optional[dict]:
         """
@@ -139,29 +249,54 @@ class WeatherAPIProvider(WeatherService):
         cache_key = self._cache_key('weather', location)
 
         # Check cache first
-        if cache_key in self._weather_cache:
-            return self._weather_cache[cache_key]
+        cached = self._cache_lookup(self._weather_cache, 'weather', cache_key)
+        if cached is not None:
+            return cached
+
+        return self._fetch_weather_data(location, cache_key)
 
+    def _fetch_weather_data(self, location: str, cache_key: tuple) -> Optional[dict]:
+        """
+        Fetch weather data from the API and cache it under cache_key.
+
+        Args:
+            location: Location query
+            cache_key: Weather cache key for the location
+
+        Returns:
+            Weather data dictionary, or None if the location is invalid
+        """
         try:
-            # Get forecast with alerts and air quality
-            forecast_data = self._make_request('forecast.json', {
-                'q': location,
-                'days': 3,
-                'aqi': 'yes',
-                'alerts': 'yes'
-            })
+            # Get forecast with alerts and air quality. A full-length forecast
+            # cached by the detailed view is sliced when present; otherwise
+            # only the summary days are requested, keeping the common
+            # home page response small.
+            forecast_data = self._raw_forecast_cache.get(
+                self._cache_key('forecast', location, FORECAST_MAX_DAYS)
+            )
+            if forecast_data is None:
+                forecast_data = self._fetch_forecast(location, SUMMARY_FORECAST_DAYS)
 
             if not forecast_data:
                 return None
 
+            forecast = forecast_data.get('forecast', {})
+
             # Get historical data for the past 7 days
             history_data = self._get_history(location, days=7)
 
+            # Copies, so enriching this result never touches the cached
+            # forecast response the other views slice
             result = {
-                'location': forecast_data.get('location', {}),
-                'current': forecast_data.get('current', {}),
-                'forecast': forecast_data.get('forecast', {}),
-                'alerts': forecast_data.get('alerts', {}),
+                'location': {**forecast_data.get('location', {})},
+                'current': {**forecast_data.get('current', {})},
+                'forecast': {
+                    **forecast,
+                    'forecastday': [
+                        {**day} for day in forecast.get('forecastday', [])[:SUMMARY_FORECAST_DAYS]
+                    ]
+                },
+                'alerts': {**forecast_data.get('alerts', {})},
                 'history': history_data
             }
 
@@ -175,36 +310,153 @@ class WeatherAPIProvider(WeatherService):
             print(f"Error fetching weather data for {location}: {e}")
             return None
 
+    def get_bulk_weather(self, locations: list[str]) -> list[dict]:
+        """
+        Get weather data for multiple locations concurrently.
+
+        Cached locations are served directly. Each distinct uncached location
+        is fetched once on a worker thread so the upstream round trips overlap
+        instead of running back to back.
+
+        Args:
+            locations: List of location queries
+
+        Returns:
+            List of weather data dictionaries in request order
+            (excludes failed requests)
+        """
+        if not locations:
+            return []
+
+        cache_keys = [self._cache_key('weather', location) for location in locations]
+
+        weather_by_key = {}
+        misses = {}
+        for location, cache_key in zip(locations, cache_keys):
+            if cache_key in weather_by_key or cache_key in misses:
+                continue
+            cached = self._cache_lookup(self._weather_cache, 'weather', cache_key)
+            if cached is not None:
+                weather_by_key[cache_key] = cached
+            else:
+                misses[cache_key] = location
+
+        if misses:
+            max_workers = min(BULK_MAX_WORKERS, len(misses))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                fetched = executor.map(self._fetch_weather_data, misses.values(), misses.keys())
+                weather_by_key.update(zip(misses.keys(), fetched))
+
+        results = []
+        for cache_key in cache_keys:
+            data = weather_by_key.get(cache_key)
+            if data:
+                results.append(data)
+        return results
+
     def _get_history(self, location: str, days: int = 7) -> list[dict]:
         """
         Fetch historical weather data for the past N days.
 
+        Tries a single date-range request first. If the API key's plan does
+        not support ranges, falls back to concurrent per-day requests.
+
         Args:
             location: Location query
             days: Number of days of history to fetch
 
         Returns:
-            List of historical weather data dictionaries
+            List of historical weather data dictionaries, most recent day first
+        """
+        if days <= 0:
+            return []
+
+        # Read the clock once so every date comes from the same day
+        today = datetime.now().date()
+        dates = [(today - timedelta(days=i)).isoformat() for i in range(1, days + 1)]
+
+        if self._history_range_supported:
+            history_data = self._get_history_range(location, dates)
+            if history_data is not None:
+                return history_data
+
+        return self._get_history_by_day(location, dates)
+
+    def _get_history_range(self, location: str, dates: list[str]) -> Optional[list[dict]]:
+        """
+        Fetch history for a span of dates with one history.json request.
+
+        Args:
+            location: Location query
+            dates: Dates to fetch, most recent first
+
+        Returns:
+            List of per-day history responses (same shape as a single-day
+            history.json response), most recent day first, or None if the
+            range request failed or did not cover every date
+        """
+        try:
+            data = self._make_request('history.json', {
+                'q': location,
+                'dt': dates[-1],
+                'end_dt': dates[0]
+            })
+        except WeatherServiceError:
+            # Possibly transient; retry the range on the next fetch
+            return None
+
+        forecast_days = (data or {}).get('forecast', {}).get('forecastday')
+        if not forecast_days:
+            # Rejected (400) or empty: the plan does not support date ranges
+            self._history_range_supported = False
+            return None
+
+        forecast_days = forecast_days[::-1]
+        if [day.get('date') for day in forecast_days] != dates:
+            # Plans without range support may ignore end_dt and return only
+            # the dt day; treat a partial span like a rejected range
+            self._history_range_supported = False
+            return None
+
+        location_data = data.get('location', {})
+        return [
+            {'location': location_data, 'forecast': {'forecastday': [day]}}
+            for day in forecast_days
+        ]
+
+    def _get_history_by_day(self, location: str, dates: list[str]) -> list[dict]:
+        """
+        Fetch history with one history.json request per date, concurrently.
+
+        Args:
+            location: Location query
+            dates: Dates to fetch, most recent first
+
+        Returns:
+            List of historical weather data dictionaries, most recent day first
         """
-        history_data = []
-        for i in range(1, days + 1):
-            date = (datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d')
+        def fetch_day(date: str) -> Optional[dict]:
             try:
-                data = self._make_request('history.json', {
+                return self._make_request('history.json', {
                     'q': location,
                     'dt': date
                 })
-                if data:
-                    history_data.append(data)
             except WeatherServiceError:
                 # Continue even if some history requests fail
-                continue
-        return history_data
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(len(dates), HISTORY_MAX_WORKERS)) as executor:
+            results = list(executor.map(fetch_day, dates))
+        return [data for data in results if data]
 
     def validate_location(self, location: str) -> tuple[bool, Optional[dict]]:
         """
         Validate if a location exists using the current weather endpoint.
 
+        Valid locations are cached for an hour. Locations the API reports as
+        not found are cached briefly so repeated typos do not each cost an
+        upstream request; request failures are never cached.
+
         Args:
             location: Location query to validate
 
@@ -214,19 +466,25 @@ class WeatherAPIProvider(WeatherService):
         cache_key = self._cache_key('validate', location)
 
         # Check cache first
-        if cache_key in self._location_cache:
-            return self._location_cache[cache_key]
+        cached = self._cache_lookup(self._location_cache, 'validate', cache_key)
+        if cached is not None:
+            return cached
+
+        cached = self._cache_lookup(self._invalid_location_cache, 'validate_invalid', cache_key)
+        if cached is not None:
+            return cached
 
         try:
             data = self._make_request('current.json', {'q': location})
             if data:
                 result = (True, data.get('location', {}))
-                # Cache only successful validations
                 self._location_cache[cache_key] = result
                 return result
 
-            # For invalid or empty responses, do not cache the negative result
-            return False, None
+            # Location not found; remember it briefly
+            result = (False, None)
+            self._invalid_location_cache[cache_key] = result
+            return result
         except WeatherServiceError:
             # On API errors, also avoid caching so callers can retry quickly
             return False, None
@@ -235,6 +493,9 @@ class WeatherAPIProvider(WeatherService):
         """
         Search for locations matching a query.
 
+        Repeats of a query that differ only in case or surrounding
+        whitespace share one cache entry.
+
         Args:
             query: Search string (partial city name, etc.)
             limit: Maximum results to return
@@ -242,28 +503,33 @@ class WeatherAPIProvider(WeatherService):
         Returns:
             List of SearchResult objects
         """
-        if not query or len(query) < 2:
+        normalized = (query or '').strip()
+        if len(normalized) < 2:
             return []
 
-        cache_key = self._cache_key('search', query, limit)
+        cache_key = self._cache_key('search', normalized, limit)
 
         # Check cache first
-        if cache_key in self._search_cache:
-            return self._search_cache[cache_key]
+        cached = self._cache_lookup(self._search_cache, 'search', cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            data = self._make_request('search.json', {'q': query})
+            data = self._make_request('search.json', {'q': normalized})
             if not data:
                 return []
 
             results = []
             for item in data[:limit]:
+                name = item.get('name', '')
+                region = item.get('region', '')
+                country = item.get('country', '')
                 results.append(SearchResult(
-                    name=item.get('name', ''),
-                    region=item.get('region', ''),
-                    country=item.get('country', ''),
-                    display=f"{item.get('name', '')}, {item.get('region', '')}, {item.get('country', '')}",
-                    value=item.get('name', '')
+                    name=name,
+                    region=region,
+                    country=country,
+                    display=f"{name}, {region}, {country}",
+                    value=name
                 ))
 
             # Cache the results
@@ -287,43 +553,44 @@ class WeatherAPIProvider(WeatherService):
         cache_key = self._cache_key('detailed', location, days)
 
         # Check cache first
-        if cache_key in self._forecast_cache:
-            return self._forecast_cache[cache_key]
+        cached = self._cache_lookup(self._forecast_cache, 'detailed', cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            data = self._make_request('forecast.json', {
-                'q': location,
-                'days': days,
-                'aqi': 'yes',
-                'alerts': 'yes'
-            })
+            data = self._fetch_forecast(location, max(days, FORECAST_MAX_DAYS))
 
             if not data:
                 return None
 
+            forecast = data.get('forecast', {})
+            forecast_days = forecast.get('forecastday', [])[:days]
+
             # Extract astronomy and hourly data from forecast days
             astronomy = []
             hourly = []
 
-            for day in data.get('forecast', {}).get('forecastday', []):
+            for index, day in enumerate(forecast_days):
+                date = day.get('date')
+                astro = day.get('astro', {})
                 astronomy.append({
-                    'date': day.get('date'),
-                    'astro': day.get('astro', {}),
-                    'moon_phase': day.get('astro', {}).get('moon_phase', ''),
-                    'moon_illumination': day.get('astro', {}).get('moon_illumination', '')
+                    'date': date,
+                    'astro': astro,
+                    'moon_phase': astro.get('moon_phase', ''),
+                    'moon_illumination': astro.get('moon_illumination', '')
                 })
 
                 # Include hourly data for first 3 days
-                if len(hourly) < 3:
+                if index < 3:
                     hourly.append({
-                        'date': day.get('date'),
+                        'date': date,
                         'hours': day.get('hour', [])
                     })
 
             result = {
                 'location': data.get('location', {}),
                 'current': data.get('current', {}),
-                'forecast': data.get('forecast', {}),
+                'forecast': {**forecast, 'forecastday': forecast_days},
                 'alerts': data.get('alerts', {}),
                 'astronomy': astronomy,
                 'hourly': hourly
@@ -352,8 +619,9 @@ class WeatherAPIProvider(WeatherService):
         cache_key = self._cache_key('hourly', location, date)
 
         # Check cache first
-        if cache_key in self._hourly_cache:
-            return self._hourly_cache[cache_key]
+        cached = self._cache_lookup(self._hourly_cache, 'hourly', cache_key)
+        if cached is not None:
+            return cached
 
         try:
             target_date = datetime.strptime(date, '%Y-%m-%d').date()
@@ -439,8 +707,9 @@ class WeatherAPIProvider(WeatherService):
         cache_key = self._cache_key('current', location)
 
         # Check cache first
-        if cache_key in self._current_cache:
-            return self._current_cache[cache_key]
+        cached = self._cache_lookup(self._current_cache, 'current', cache_key)
+        if cached is not None:
+            return cached
 
         try:
             result = self._make_request('current.json', {
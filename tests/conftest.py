@@ -2,6 +2,101 @@
 
 import sys
 import os
+import orjson
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
 
 # Ensure the project root is on the Python path so tests can import modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+
+class UpstreamResponse:
+    """Stand-in for the requests.Response that Session.get returns to the provider.
+
+    The provider only reads status_code and content and calls
+    raise_for_status(), so a slotted object is enough (and much cheaper to
+    build than a MagicMock). The payload is serialized with orjson unless
+    pre-serialized bytes are passed as content.
+    """
+    __slots__ = ('status_code', 'content')
+
+    def __init__(self, payload=None, status_code=200, content=None):
+        self.status_code = status_code
+        self.content = orjson.dumps(payload) if content is None else content
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f'{self.status_code} Error', response=self)
+
+
+# The home page (the only page the app tests render) and the templates it
+# extends and includes
+RENDERED_TEMPLATES = (
+    'home.html',
+    'base.html',
+    'components/debug_panel.html',
+    'components/search-bar.html',
+    'components/recent-cities.html',
+    'components/astronomy.html',
+)
+
+
+@pytest.fixture(scope='session')
+def precompiled_templates():
+    """Compile the rendered templates once, before the first test requests a page.
+
+    Used by the app client fixtures, so unit tests don't import the app.
+    """
+    from main import app
+    for name in RENDERED_TEMPLATES:
+        app.jinja_env.get_template(name)
+
+
+
+@pytest.fixture(scope='module')
+def route_modules():
+    """Route modules holding the weather service singletons."""
+    import routes.forecast as forecast
+    import routes.home as home
+    return forecast, home
+
+
+@pytest.fixture
+def reset_weather_service(route_modules):
+    """Reset the weather service singleton before and after a test.
+
+    App test modules apply it to every test with
+    pytestmark = pytest.mark.usefixtures('reset_weather_service').
+    """
+    forecast, home = route_modules
+    forecast._weather_service = home._weather_service = None
+    yield
+    forecast._weather_service = home._weather_service = None
+
+
+# Address the script-style UI tests expect the app to be served on
+LIVE_SERVER_URL = 'http://localhost:5000'
+
+
+@pytest.fixture(scope='session')
+def live_server():
+    """Skip tests that need the app running on LIVE_SERVER_URL when it isn't.
+
+    Probed once per session; pytest caches the skip for every later request.
+    """
+    try:
+        requests.head(LIVE_SERVER_URL, timeout=0.5)
+    except requests.RequestException:
+        pytest.skip(f'Flask app is not running on {LIVE_SERVER_URL}')
+    return LIVE_SERVER_URL
+
+
+@pytest.fixture(scope='session')
+def session():
+    """One pooled keep-alive HTTP session for the live-server tests."""
+    with requests.Session() as session:
+        session.mount('http://', HTTPAdapter(pool_connections=8, pool_maxsize=16))
+        session.headers['Connection'] = 'keep-alive'
+        yield session
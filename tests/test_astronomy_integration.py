@@ -2,37 +2,71 @@
 Integration test to verify astronomy template rendering.
 """
 
+import copy
+import re
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from main import app
 from datetime import datetime, timedelta
+from tests.conftest import UpstreamResponse
+
+pytestmark = pytest.mark.usefixtures('reset_weather_service')
 
 
 @pytest.fixture
-def client():
+def client(precompiled_templates):
     app.testing = True
     with app.test_client() as client:
         yield client
 
 
 @pytest.fixture(autouse=True)
-def reset_weather_service():
-    """Reset the weather service singleton before each test."""
-    import routes.forecast as forecast
-    import routes.home as home
-    forecast._weather_service = None
-    home._weather_service = None
-    yield
-    forecast._weather_service = None
-    home._weather_service = None
+def api_key(monkeypatch):
+    """Configure a test API key, restored after each test."""
+    monkeypatch.setenv('WEATHER_API_KEY', 'test_api_key')
+
+
+# Fragments the home page must contain when astronomy data is present
+ASTRONOMY_PAGE_NEEDLES = {
+    'astronomy-section', 'Sun & Moon',          # astronomy section
+    '07:30 AM', '05:45 PM',                     # sunrise, sunset
+    '08:30 PM', '09:15 AM',                     # moonrise, moonset
+    'Waxing Crescent',                          # moon phase
+    '10h 15m',                                  # calculated daylight
+    'astronomyMultiDayToggle', 'Extended Outlook',  # multi-day toggle
+}
+ASTRONOMY_PAGE_PATTERN = re.compile('|'.join(map(re.escape, ASTRONOMY_PAGE_NEEDLES)))
+
+
+# Eight phases, so a day number maps to a phase with & 7
+_PHASES = ('Waxing Crescent', 'First Quarter', 'Waxing Gibbous',
+           'Full Moon', 'Waning Gibbous', 'Last Quarter',
+           'Waning Crescent', 'New Moon')
 
 
 def _get_moon_phase_for_day(day_number):
     """Helper to get moon phase based on day number in forecast."""
-    phases = ['Waxing Crescent', 'First Quarter', 'Waxing Gibbous', 
-              'Full Moon', 'Waning Gibbous', 'Last Quarter', 
-              'Waning Crescent', 'New Moon']
-    return phases[day_number % len(phases)]
+    return _PHASES[day_number & 7]
+
+
+# Day summary and astro times shared by every future forecast day
+_FUTURE_DAY = {
+    'condition': {
+        'text': 'Sunny',
+        'icon': '//cdn.weatherapi.com/weather/64x64/day/113.png'
+    },
+    'maxtemp_c': 20.0,
+    'maxtemp_f': 68.0,
+    'mintemp_c': 14.0,
+    'mintemp_f': 57.2,
+    'daily_chance_of_rain': 10
+}
+_FUTURE_ASTRO = {
+    'sunrise': '07:29 AM',
+    'sunset': '05:46 PM',
+    'moonrise': '09:00 PM',
+    'moonset': '10:00 AM'
+}
 
 
 def create_mock_weather_response_with_astronomy():
@@ -91,22 +125,9 @@ def create_mock_weather_response_with_astronomy():
             ] + [
                 {
                     'date': date.strftime('%Y-%m-%d'),
-                    'day': {
-                        'condition': {
-                            'text': 'Sunny',
-                            'icon': '//cdn.weatherapi.com/weather/64x64/day/113.png'
-                        },
-                        'maxtemp_c': 20.0,
-                        'maxtemp_f': 68.0,
-                        'mintemp_c': 14.0,
-                        'mintemp_f': 57.2,
-                        'daily_chance_of_rain': 10
-                    },
+                    'day': _FUTURE_DAY,
                     'astro': {
-                        'sunrise': '07:29 AM',
-                        'sunset': '05:46 PM',
-                        'moonrise': '09:00 PM',
-                        'moonset': '10:00 AM',
+                        **_FUTURE_ASTRO,
                         'moon_phase': _get_moon_phase_for_day(i),
                         'moon_illumination': str(15 + i * 10)
                     }
@@ -118,61 +139,44 @@ def create_mock_weather_response_with_astronomy():
     }
 
 
-@patch('services.weatherapi_provider.requests.get')
-def test_home_page_with_astronomy_data(mock_get, client):
+@pytest.fixture(scope='session')
+def astronomy_weather_response():
+    """Mock weather response with astronomy data, built once per test session.
+
+    Shared between tests; copy it before mutating.
+    """
+    return create_mock_weather_response_with_astronomy()
+
+
+@patch('services.weatherapi_provider.requests.Session.get')
+def test_home_page_with_astronomy_data(mock_get, client, astronomy_weather_response):
     """Test that home page includes astronomy data when location is provided."""
-    import os
-    os.environ['WEATHER_API_KEY'] = 'test_api_key'
     
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = create_mock_weather_response_with_astronomy()
-    mock_response.raise_for_status = MagicMock()
-    mock_get.return_value = mock_response
+    mock_get.return_value = UpstreamResponse(astronomy_weather_response)
     
     response = client.get('/?location=London')
     
     assert response.status_code == 200
     html = response.data.decode('utf-8')
     
-    # Check for astronomy section
-    assert 'astronomy-section' in html
-    assert 'Sun & Moon' in html
-    
-    # Check for current day astronomy data
-    assert '07:30 AM' in html  # sunrise
-    assert '05:45 PM' in html  # sunset
-    assert '08:30 PM' in html  # moonrise
-    assert '09:15 AM' in html  # moonset
-    assert 'Waxing Crescent' in html  # moon phase
-    
-    # Check for daylight duration
-    assert '10h 15m' in html  # calculated daylight
-    
-    # Check for multi-day toggle
-    assert 'astronomyMultiDayToggle' in html
-    assert 'Extended Outlook' in html
+    # All expected fragments are found in a single scan of the page
+    found = set(ASTRONOMY_PAGE_PATTERN.findall(html))
+    assert ASTRONOMY_PAGE_NEEDLES - found == set()
     
     # Check for moon phase emoji (should be in the HTML)
     assert '🌒' in html or 'moon_phase_emoji' in html
 
 
-@patch('services.weatherapi_provider.requests.get')
-def test_astronomy_with_no_moonrise(mock_get, client):
+@patch('services.weatherapi_provider.requests.Session.get')
+def test_astronomy_with_no_moonrise(mock_get, client, astronomy_weather_response):
     """Test handling of polar regions with no moonrise/moonset."""
-    import os
-    os.environ['WEATHER_API_KEY'] = 'test_api_key'
     
-    weather_data = create_mock_weather_response_with_astronomy()
+    weather_data = copy.deepcopy(astronomy_weather_response)
     # Simulate polar region with no moonrise
     weather_data['forecast']['forecastday'][0]['astro']['moonrise'] = 'No moonrise'
     weather_data['forecast']['forecastday'][0]['astro']['moonset'] = 'No moonset'
     
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = weather_data
-    mock_response.raise_for_status = MagicMock()
-    mock_get.return_value = mock_response
+    mock_get.return_value = UpstreamResponse(weather_data)
     
     response = client.get('/?location=NorthPole')
     
@@ -187,7 +191,7 @@ def test_astronomy_with_no_moonrise(mock_get, client):
     # The template uses {% if astronomy_info.has_moonrise %} to conditionally show
 
 
-@patch('services.weatherapi_provider.requests.get')
+@patch('services.weatherapi_provider.requests.Session.get')
 def test_home_page_without_location_no_astronomy(mock_get, client):
     """Test that home page without location doesn't show astronomy section."""
     response = client.get('/')
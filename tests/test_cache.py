@@ -0,0 +1,51 @@
+"""
+Tests for the expiring LRU cache used by weather providers.
+"""
+
+from unittest.mock import patch
+from services.cache import ExpiringCache
+
+
+def test_get_returns_stored_value():
+    cache = ExpiringCache(maxsize=2, ttl=60)
+    cache['a'] = 1
+    assert cache.get('a') == 1
+    assert cache.get('missing') is None
+    assert cache.get('missing', 'default') == 'default'
+
+
+@patch('services.cache.monotonic')
+def test_entries_expire_after_ttl(mock_monotonic):
+    cache = ExpiringCache(maxsize=2, ttl=60)
+    mock_monotonic.return_value = 1000.0
+    cache['a'] = 1
+
+    mock_monotonic.return_value = 1059.0
+    assert cache.get('a') == 1
+
+    mock_monotonic.return_value = 1060.0
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ExpiringCache(maxsize=2, ttl=60)
+    cache['a'] = 1
+    cache['b'] = 2
+    cache.get('a')
+    cache['c'] = 3
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+
+def test_overwrite_refreshes_entry():
+    cache = ExpiringCache(maxsize=2, ttl=60)
+    cache['a'] = 1
+    cache['b'] = 2
+    cache['a'] = 10
+    cache['c'] = 3
+
+    assert cache.get('a') == 10
+    assert cache.get('b') is None
@@ -3,14 +3,15 @@ Tests for chat agent functionality
 """
 
 import pytest
-import json
+import orjson
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
-from routes.chat import chat_bp, build_system_prompt
+from routes.chat import chat_bp, build_system_prompt, _render_system_prompt
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def client():
-    """Create a test client for the chat blueprint."""
+    """Create a test client for the chat blueprint, shared by this module's tests."""
     from flask import Flask
     app = Flask(__name__)
     app.register_blueprint(chat_bp, url_prefix='/api/chat')
@@ -25,7 +26,7 @@ def test_get_chat_config(client):
     response = client.get('/api/chat/config')
     assert response.status_code == 200
     
-    data = json.loads(response.data)
+    data = orjson.loads(response.data)
     assert 'configured' in data
     assert 'endpoint' in data
     assert 'deployment' in data
@@ -35,12 +36,12 @@ def test_chat_completions_missing_message(client):
     """Test chat completions endpoint with missing message."""
     response = client.post(
         '/api/chat/completions',
-        data=json.dumps({}),
+        data=orjson.dumps({}),
         content_type='application/json'
     )
     assert response.status_code == 400
     
-    data = json.loads(response.data)
+    data = orjson.loads(response.data)
     assert 'error' in data
 
 
@@ -146,11 +147,44 @@ def test_build_system_prompt_with_full_context():
     assert 'Good' in prompt
 
 
+def test_build_system_prompt_reuses_cached_prompt():
+    """Test that an unchanged context is served from the prompt cache."""
+    context = {
+        'currentWeather': {
+            'location': {'name': 'Oslo', 'country': 'Norway'},
+            'current': {'temp_c': -4, 'condition': {'text': 'Snow'}}
+        }
+    }
+    _render_system_prompt.cache_clear()
+    
+    first = build_system_prompt(context)
+    second = build_system_prompt(orjson.loads(orjson.dumps(context)))
+    assert first == second
+    assert _render_system_prompt.cache_info().hits == 1
+    
+    context['currentWeather']['current']['temp_c'] = -6
+    assert '-6°C' in build_system_prompt(context)
+
+
+def test_build_system_prompt_unhashable_value():
+    """Test that unexpected nested values still produce a prompt."""
+    context = {
+        'currentWeather': {
+            'location': {'name': 'Oslo'},
+            'current': {'temp_c': {'value': -4}, 'condition': {'text': 'Snow'}}
+        }
+    }
+    
+    prompt = build_system_prompt(context)
+    assert 'Oslo' in prompt
+    assert 'Snow' in prompt
+
+
 def test_chat_completions_non_streaming(client):
     """Test that non-streaming mode returns 501."""
     response = client.post(
         '/api/chat/completions',
-        data=json.dumps({
+        data=orjson.dumps({
             'message': 'What is the weather?',
             'context': {},
             'stream': False
@@ -159,3 +193,25 @@ def test_chat_completions_non_streaming(client):
     )
     
     assert response.status_code == 501
+
+
+@patch('routes.chat.get_deployment_name', return_value='test-deployment')
+@patch('routes.chat.get_azure_client')
+def test_chat_completions_streaming(mock_get_client, mock_deployment, client):
+    """Test that streamed tokens are framed as SSE JSON events."""
+    chunks = [
+        SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+        for text in ['Sunny ', 'and "warm"']
+    ]
+    mock_get_client.return_value.chat.completions.create.return_value = chunks
+    
+    response = client.post(
+        '/api/chat/completions',
+        data=orjson.dumps({'message': 'Weather?', 'context': {}}),
+        content_type='application/json'
+    )
+    
+    assert response.mimetype == 'text/event-stream'
+    events = [line[len('data: '):] for line in response.data.decode().split('\n\n') if line]
+    assert [orjson.loads(event)['content'] for event in events[:-1]] == ['Sunny ', 'and "warm"']
+    assert events[-1] == '[DONE]'
@@ -1,95 +1,112 @@
 # Import necessary modules for testing
-import os
+import orjson
 import pytest
-from unittest.mock import patch, MagicMock
+from pathlib import Path
+from unittest.mock import Mock
 from flask import Flask
 from main import app
+from services import WeatherService, WeatherServiceError
+from tests.conftest import UpstreamResponse
 
-@pytest.fixture
-def client():
-    # Set up a test client for the Flask application
+pytestmark = pytest.mark.usefixtures('reset_weather_service')
+
+# Recorded forecast.json responses, parsed once and served by FakeWeatherService
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+FULL_WEATHER_DATA = orjson.loads((FIXTURES_DIR / 'forecast_full.json').read_bytes())
+MINIMAL_WEATHER_DATA = orjson.loads((FIXTURES_DIR / 'forecast_minimal.json').read_bytes())
+
+# Small upstream payloads, serialized once at import and shared by every test
+VALIDATE_CONTENT = orjson.dumps({'location': {'name': 'Test City'}})
+SEARCH_CONTENT = orjson.dumps([
+    {'name': 'London', 'region': 'City of London', 'country': 'United Kingdom'}
+])
+
+
+class FakeWeatherService(WeatherService):
+    """In-memory weather service returning one canned payload, or raising error."""
+
+    def __init__(self, payload=None, error=None):
+        self.payload = payload
+        self.error = error
+
+    def _respond(self):
+        if self.error is not None:
+            raise self.error
+        return self.payload
+
+    def get_weather_data(self, location):
+        return self._respond()
+
+    def validate_location(self, location):
+        return self.payload is not None, self.payload
+
+    def search_locations(self, query, limit=10):
+        return []
+
+    def get_detailed_forecast(self, location, days=10):
+        return self._respond()
+
+    def get_hourly_forecast(self, location, date):
+        return self._respond()
+
+    def get_current_location_by_ip(self, ip=None):
+        return None
+
+    def get_bulk_weather(self, locations):
+        return [self._respond() for _ in locations]
+
+
+@pytest.fixture(scope='session')
+def client(precompiled_templates):
+    # Set up one test client for the Flask application, shared by all tests;
+    # the app keeps no per-client state (no sessions or cookies)
     app.testing = True
     with app.test_client() as client:
         yield client
 
+
 @pytest.fixture(autouse=True)
-def reset_weather_service():
-    """Reset the weather service singleton before each test."""
-    import routes.forecast as forecast
-    import routes.home as home
-    forecast._weather_service = None
-    home._weather_service = None
-    yield
-    forecast._weather_service = None
-    home._weather_service = None
-
-
-@patch('services.weatherapi_provider.requests.get')
-def test_missing_zip_code(mock_get, client):
+def mock_get(monkeypatch):
+    """Replace upstream WeatherAPI calls with a plain Mock for every test."""
+    mock = Mock()
+    monkeypatch.setattr('services.weatherapi_provider.requests.Session.get', mock)
+    return mock
+
+
+@pytest.fixture
+def fake_service(route_modules):
+    """Install a FakeWeatherService in the route singletons, skipping the provider."""
+    def install(payload=None, error=None):
+        service = FakeWeatherService(payload, error)
+        forecast, home = route_modules
+        forecast._weather_service = home._weather_service = service
+        return service
+    return install
+
+
+def test_missing_zip_code(client, monkeypatch):
     # Test the behavior when no ZIP code is provided in the request
     # With browser User-Agent, returns HTML page (no error)
     # With CLI User-Agent and no default ZIP, returns error
-    os.environ.pop('DEFAULT_ZIP_CODE', None)
+    monkeypatch.delenv('DEFAULT_ZIP_CODE', raising=False)
     headers = {'User-Agent': 'curl/7.68.0'}
     response = client.get('/forecast', headers=headers)
     assert response.status_code == 400
-    assert response.json == {'error': 'ZIP code is required and no default is configured'}
+    assert orjson.loads(response.data) == {'error': 'ZIP code is required and no default is configured'}
 
 
-@patch('services.weatherapi_provider.requests.get')
-def test_missing_api_key(mock_get, client):
+def test_missing_api_key(client, monkeypatch):
     # Test the behavior when the API key is not configured
-    os.environ.pop('WEATHER_API_KEY', None)
+    monkeypatch.delenv('WEATHER_API_KEY', raising=False)
     headers = {'User-Agent': 'curl/7.68.0'}
     response = client.get('/forecast?zip=12345', headers=headers)
     assert response.status_code == 500
-    assert response.json == {'error': 'Unable to fetch weather data'}
+    assert orjson.loads(response.data) == {'error': 'Unable to fetch weather data'}
 
 
-@patch('services.weatherapi_provider.requests.get')
-def test_successful_response(mock_get, client):
+def test_successful_response(fake_service, client):
     # Test a successful response from the weather API
-    os.environ['WEATHER_API_KEY'] = 'test_api_key'
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        'location': {'name': 'Test City', 'region': 'Test Region', 'country': 'Test Country'},
-        'current': {
-            'temp_c': 20.0,
-            'temp_f': 68.0,
-            'feelslike_c': 19.0,
-            'feelslike_f': 66.0,
-            'condition': {'text': 'Sunny', 'icon': '//cdn.weatherapi.com/icon.png'},
-            'wind_kph': 10.0,
-            'wind_mph': 6.2,
-            'humidity': 50,
-            'uv': 5,
-            'vis_km': 10.0,
-            'pressure_mb': 1015.0,
-            'precip_mm': 0.0,
-            'cloud': 20,
-            'air_quality': {}
-        },
-        'forecast': {
-            'forecastday': [
-                {
-                    'date': '2023-01-01',
-                    'day': {
-                        'condition': {'text': 'Sunny', 'icon': '//cdn.weatherapi.com/icon.png'},
-                        'maxtemp_c': 25.0,
-                        'maxtemp_f': 77.0,
-                        'mintemp_c': 15.0,
-                        'mintemp_f': 59.0,
-                        'daily_chance_of_rain': 0,
-                        'daily_chance_of_snow': 0,
-                    },
-                }
-            ]
-        },
-        'alerts': {'alert': []}
-    }
-    mock_response.raise_for_status = MagicMock()
-    mock_get.return_value = mock_response
+    fake_service(FULL_WEATHER_DATA)
 
     headers = {'User-Agent': 'Mozilla/5.0 Chrome/91.0'}
     response = client.get('/forecast?zip=12345', headers=headers)
@@ -98,97 +115,30 @@ def test_successful_response(mock_get, client):
     assert '/?location=12345' in response.location
 
 
-@patch('services.weatherapi_provider.requests.get')
-def test_api_error_response(mock_get, client):
-    # Test the behavior when the weather API raises an exception
-    os.environ['WEATHER_API_KEY'] = 'test_api_key'
-    mock_get.side_effect = Exception('API error')
+def test_api_error_response(fake_service, client):
+    # Test the behavior when the weather service cannot fetch data
+    fake_service(None)
 
     headers = {'User-Agent': 'curl/7.68.0'}
     response = client.get('/forecast?zip=12345', headers=headers)
     assert response.status_code == 500
-    assert response.json == {'error': 'Unable to fetch weather data'}
+    assert orjson.loads(response.data) == {'error': 'Unable to fetch weather data'}
 
 
-@patch('services.weatherapi_provider.requests.get')
-def test_cli_user_agent(mock_get, client):
+def test_cli_user_agent(fake_service, client):
     # Test the response for a CLI user agent (returns JSON)
-    os.environ['WEATHER_API_KEY'] = 'test_api_key'
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        'location': {'name': 'Test City'},
-        'current': {'temp_c': 20.0},
-        'forecast': {
-            'forecastday': [
-                {
-                    'date': '2023-01-01',
-                    'day': {
-                        'condition': {'text': 'Sunny', 'icon': '//cdn.weatherapi.com/icon.png'},
-                        'maxtemp_c': 25.0,
-                        'maxtemp_f': 77.0,
-                        'mintemp_c': 15.0,
-                        'mintemp_f': 59.0,
-                    },
-                }
-            ]
-        },
-        'alerts': {}
-    }
-    mock_response.raise_for_status = MagicMock()
-    mock_get.return_value = mock_response
+    fake_service(MINIMAL_WEATHER_DATA)
 
     headers = {'User-Agent': 'curl/7.68.0'}
     response = client.get('/forecast?zip=12345', headers=headers)
     assert response.status_code == 200
     assert response.is_json
-    assert 'forecast' in response.json
+    assert 'forecast' in orjson.loads(response.data)
 
 
-@patch('services.weatherapi_provider.requests.get')
-def test_browser_user_agent(mock_get, client):
+def test_browser_user_agent(fake_service, client):
     # Test the response for a browser user agent (returns HTML)
-    os.environ['WEATHER_API_KEY'] = 'test_api_key'
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        'location': {'name': 'Test City', 'region': 'Test Region', 'country': 'Test Country'},
-        'current': {
-            'temp_c': 20.0,
-            'temp_f': 68.0,
-            'feelslike_c': 19.0,
-            'feelslike_f': 66.0,
-            'condition': {'text': 'Sunny', 'icon': '//cdn.weatherapi.com/icon.png'},
-            'wind_kph': 10.0,
-            'wind_mph': 6.2,
-            'humidity': 50,
-            'uv': 5,
-            'vis_km': 10.0,
-            'pressure_mb': 1015.0,
-            'precip_mm': 0.0,
-            'cloud': 20,
-            'air_quality': {}
-        },
-        'forecast': {
-            'forecastday': [
-                {
-                    'date': '2023-01-01',
-                    'day': {
-                        'condition': {'text': 'Sunny', 'icon': '//cdn.weatherapi.com/icon.png'},
-                        'maxtemp_c': 25.0,
-                        'maxtemp_f': 77.0,
-                        'mintemp_c': 15.0,
-                        'mintemp_f': 59.0,
-                        'daily_chance_of_rain': 0,
-                        'daily_chance_of_snow': 0,
-                    },
-                }
-            ]
-        },
-        'alerts': {'alert': []}
-    }
-    mock_response.raise_for_status = MagicMock()
-    mock_get.return_value = mock_response
+    fake_service(FULL_WEATHER_DATA)
 
     headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
     response = client.get('/forecast?zip=12345', headers=headers)
@@ -197,21 +147,19 @@ def test_browser_user_agent(mock_get, client):
     assert '/?location=12345' in response.location
 
 
-@patch('services.weatherapi_provider.requests.get')
-def test_home_route_with_error(mock_get, client):
+def test_home_route_with_error(fake_service, client):
     # Test error handling in home route
-    os.environ['WEATHER_API_KEY'] = 'test_api_key'
-    mock_get.side_effect = Exception('API connection error')
+    fake_service(error=WeatherServiceError('API connection error'))
     
     response = client.get('/?location=12345')
     assert response.status_code == 200
     # Check that error message is in the response
-    assert b'Error Loading Weather Data' in response.data
-    assert b'Unable to fetch weather data for' in response.data
+    body = response.data
+    assert b'Error Loading Weather Data' in body
+    assert b'Unable to fetch weather data for' in body
 
 
-@patch('services.weatherapi_provider.requests.get')
-def test_home_route_without_location(mock_get, client):
+def test_home_route_without_location(client):
     # Test home route without location parameter (shows empty state)
     response = client.get('/')
     assert response.status_code == 200
@@ -219,130 +167,50 @@ def test_home_route_without_location(mock_get, client):
     assert b'Search for a location' in response.data
 
 
-# PWA Functionality Tests
-def test_manifest_json_accessible(client):
-    """Test that manifest.json is accessible and has correct content-type"""
-    response = client.get('/static/manifest.json')
-    assert response.status_code == 200
-    assert response.content_type == 'application/json'
-    
-    # Verify manifest content
-    manifest_data = response.json
-    assert manifest_data['name'] == 'Weather App'
-    assert manifest_data['short_name'] == 'Weather'
-    assert manifest_data['display'] == 'standalone'
-    assert manifest_data['theme_color'] == '#0078d4'
-    assert 'icons' in manifest_data
-    assert len(manifest_data['icons']) > 0
-
-
-def test_service_worker_accessible(client):
-    """Test that service worker file (sw.js) is accessible"""
-    response = client.get('/static/js/sw.js')
-    assert response.status_code == 200
-    # Content-type should be JavaScript (may include charset)
-    assert 'javascript' in response.content_type.lower()
-    
-    # Verify service worker contains key functionality
-    sw_content = response.data.decode('utf-8')
-    assert 'serviceWorker' in sw_content or 'Service Worker' in sw_content
-    assert 'install' in sw_content
-    assert 'fetch' in sw_content
-    assert 'activate' in sw_content
-
-
-def test_base_html_pwa_meta_tags(client):
-    """Test that base.html includes required PWA meta tags and manifest link"""
-    # Get a page that extends base.html
-    response = client.get('/')
-    assert response.status_code == 200
-    
-    html_content = response.data.decode('utf-8')
-    
-    # Check for PWA meta tags
-    assert 'name="theme-color"' in html_content
-    assert 'content="#0078d4"' in html_content
-    assert 'name="description"' in html_content
-    assert 'name="apple-mobile-web-app-capable"' in html_content
-    assert 'content="yes"' in html_content
-    assert 'name="apple-mobile-web-app-status-bar-style"' in html_content
-    assert 'name="apple-mobile-web-app-title"' in html_content
-    assert 'content="Weather"' in html_content
-    
-    # Check for manifest link
-    assert 'rel="manifest"' in html_content
-    assert 'manifest.json' in html_content
-    
-    # Check for apple touch icon
-    assert 'rel="apple-touch-icon"' in html_content
-
-
-def test_service_worker_registration_script(client):
-    """Test that service worker registration script is present in base.html"""
-    # Get a page that extends base.html
-    response = client.get('/')
-    assert response.status_code == 200
-    
-    html_content = response.data.decode('utf-8')
-    
-    # Check for service worker registration script
-    assert "'serviceWorker' in navigator" in html_content or '"serviceWorker" in navigator' in html_content
-    assert 'navigator.serviceWorker.register' in html_content
-    assert '/static/js/sw.js' in html_content
-    assert 'SW registered' in html_content or 'registration.scope' in html_content
-    assert 'SW registration failed' in html_content or 'error' in html_content
-
-
 # Debug Panel Tests
-def test_debug_endpoint_disabled_by_default(client):
+def test_debug_endpoint_disabled_by_default(client, monkeypatch):
     """Test that debug endpoint returns 403 when WEATHER_DEBUG_MODE is not set"""
-    os.environ.pop('WEATHER_DEBUG_MODE', None)
+    monkeypatch.delenv('WEATHER_DEBUG_MODE', raising=False)
     response = client.get('/api/debug/info')
     assert response.status_code == 403
-    assert response.json == {'error': 'Debug mode not enabled'}
+    assert orjson.loads(response.data) == {'error': 'Debug mode not enabled'}
 
 
-def test_debug_endpoint_enabled(client):
+def test_debug_endpoint_enabled(client, monkeypatch):
     """Test that debug endpoint returns info when WEATHER_DEBUG_MODE=true"""
-    os.environ['WEATHER_DEBUG_MODE'] = 'true'
+    monkeypatch.setenv('WEATHER_DEBUG_MODE', 'true')
     response = client.get('/api/debug/info')
     assert response.status_code == 200
     
-    data = response.json
+    data = orjson.loads(response.data)
     assert 'environment' in data
     assert 'server' in data
     assert 'timestamp' in data
     assert 'flask_debug' in data['environment']
     assert 'python_version' in data['server']
     assert 'flask_version' in data['server']
-    
-    # Cleanup
-    os.environ.pop('WEATHER_DEBUG_MODE', None)
 
 
-def test_debug_panel_not_included_when_disabled(client):
+def test_debug_panel_not_included_when_disabled(client, monkeypatch):
     """Test that debug panel assets are not included when debug mode is off"""
-    os.environ.pop('WEATHER_DEBUG_MODE', None)
+    monkeypatch.delenv('WEATHER_DEBUG_MODE', raising=False)
     response = client.get('/')
     assert response.status_code == 200
     
-    html_content = response.data.decode('utf-8')
+    html_content = response.get_data(as_text=True)
     assert 'debug-panel.css' not in html_content
     assert 'debug-panel.js' not in html_content
 
 
-def test_debug_panel_included_when_enabled(client):
+def test_debug_panel_included_when_enabled(client, monkeypatch):
     """Test that debug panel assets are included when debug mode is on"""
-    os.environ['WEATHER_DEBUG_MODE'] = 'true'
+    monkeypatch.setenv('WEATHER_DEBUG_MODE', 'true')
     response = client.get('/')
     assert response.status_code == 200
     
-    html_content = response.data.decode('utf-8')
+    html_content = response.get_data(as_text=True)
     assert 'debug-panel.css' in html_content
     assert 'debug-panel.js' in html_content
-    
-    # Cleanup
-    os.environ.pop('WEATHER_DEBUG_MODE', None)
 
 
 def test_dark_mode_toggle_button_exists(client):
@@ -350,7 +218,7 @@ def test_dark_mode_toggle_button_exists(client):
     response = client.get('/')
     assert response.status_code == 200
     
-    html_content = response.data.decode('utf-8')
+    html_content = response.get_data(as_text=True)
     # Verify toggle switch exists with sun/moon icons
     assert 'id="themeToggle"' in html_content
     assert 'theme-toggle-container' in html_content
@@ -364,7 +232,7 @@ def test_dark_mode_css_variables_exist(client):
     response = client.get('/static/css/app.css')
     assert response.status_code == 200
     
-    css_content = response.data.decode('utf-8')
+    css_content = response.get_data(as_text=True)
     # Verify dark mode CSS is present
     assert '[data-theme="dark"]' in css_content
     assert '--app-background' in css_content
@@ -377,9 +245,85 @@ def test_dark_mode_script_exists(client):
     response = client.get('/')
     assert response.status_code == 200
     
-    html_content = response.data.decode('utf-8')
+    html_content = response.get_data(as_text=True)
     # Verify dark mode script exists
     assert 'weather_theme' in html_content
     assert 'applyTheme' in html_content
     assert 'data-theme' in html_content
 
+
+
+# Response Compression Tests
+def test_html_response_is_compressed(client):
+    """Test that HTML responses are compressed when the client accepts gzip"""
+    response = client.get('/', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.headers.get('Content-Encoding') == 'gzip'
+
+
+def test_response_not_compressed_without_accept_encoding(client):
+    """Test that responses are sent uncompressed when the client does not ask for it"""
+    response = client.get('/')
+    assert response.status_code == 200
+    assert 'Content-Encoding' not in response.headers
+    assert b'Search for a location' in response.data
+
+
+# Metrics Tests
+def test_metrics_endpoint_reports_cache_and_upstream(mock_get, client, monkeypatch):
+    """Test that /metrics exposes cache hit/miss counters and upstream latency"""
+    monkeypatch.setenv('WEATHER_API_KEY', 'test_api_key')
+    monkeypatch.setenv('WEATHER_METRICS_ENABLED', 'true')
+    mock_get.return_value = UpstreamResponse(content=VALIDATE_CONTENT)
+
+    client.get('/api/validate-location?location=metrics-city')
+    client.get('/api/validate-location?location=metrics-city')
+
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    metrics = response.get_data(as_text=True)
+    assert 'wx_cache_miss_total{cache="validate"}' in metrics
+    assert 'wx_cache_hit_total{cache="validate"}' in metrics
+    assert 'wx_upstream_seconds_count{endpoint="current.json"}' in metrics
+
+
+def test_metrics_endpoint_disabled_by_default(client, monkeypatch):
+    """Test that /metrics is not exposed unless WEATHER_METRICS_ENABLED is set"""
+    monkeypatch.delenv('WEATHER_METRICS_ENABLED', raising=False)
+
+    response = client.get('/metrics')
+    assert response.status_code == 404
+
+
+# Bulk Weather Tests
+def test_bulk_weather_preserves_order(mock_get, client, monkeypatch):
+    """Test that bulk weather returns one result per location in request order"""
+    monkeypatch.setenv('WEATHER_API_KEY', 'test_api_key')
+
+    def fake_get(url, params=None, **kwargs):
+        return UpstreamResponse({'location': {'name': params['q']}, 'forecast': {}})
+
+    mock_get.side_effect = fake_get
+
+    locations = ['Alpha', 'Bravo', 'Charlie', 'Delta']
+    response = client.post('/api/weather/bulk', json={'locations': locations})
+    assert response.status_code == 200
+    assert [item['location']['name'] for item in orjson.loads(response.data)] == locations
+
+
+# Location Search Tests
+def test_search_locations_returns_json(mock_get, client, monkeypatch):
+    """Test that location search results are serialized with every field"""
+    monkeypatch.setenv('WEATHER_API_KEY', 'test_api_key')
+    mock_get.return_value = UpstreamResponse(content=SEARCH_CONTENT)
+
+    response = client.get('/api/search-locations?q=London')
+    assert response.status_code == 200
+    assert response.mimetype == 'application/json'
+    assert orjson.loads(response.data) == [{
+        'name': 'London',
+        'region': 'City of London',
+        'country': 'United Kingdom',
+        'display': 'London, City of London, United Kingdom',
+        'value': 'London'
+    }]
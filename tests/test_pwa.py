@@ -0,0 +1,94 @@
+"""
+Tests for Progressive Web App support: manifest, service worker and the
+PWA tags in base.html.
+"""
+
+import re
+import orjson
+import pytest
+from main import app
+
+
+# Fragments base.html must contain for installability
+PWA_META_NEEDLES = {
+    # PWA meta tags
+    'name="theme-color"', 'content="#0078d4"', 'name="description"',
+    'name="apple-mobile-web-app-capable"', 'content="yes"',
+    'name="apple-mobile-web-app-status-bar-style"',
+    'name="apple-mobile-web-app-title"', 'content="Weather"',
+    # Manifest link
+    'rel="manifest"', 'manifest.json',
+    # Apple touch icon
+    'rel="apple-touch-icon"',
+}
+# Lookahead so fragments that overlap in the page are all reported
+PWA_META_PATTERN = re.compile('(?=(' + '|'.join(map(re.escape, PWA_META_NEEDLES)) + '))')
+
+
+@pytest.fixture(scope='module')
+def client(precompiled_templates):
+    # Set up one test client for the Flask application; these tests only
+    # fetch static files and the empty home page
+    app.testing = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture(scope='module')
+def home_page(client):
+    """The home page (extends base.html), fetched once for all PWA tag checks."""
+    response = client.get('/')
+    assert response.status_code == 200
+    return response.get_data(as_text=True)
+
+
+def test_manifest_json_accessible(client):
+    """Test that manifest.json is accessible and has correct content-type"""
+    response = client.get('/static/manifest.json')
+    assert response.status_code == 200
+    assert response.content_type == 'application/json'
+    
+    # Verify manifest content
+    manifest_data = orjson.loads(response.data)
+    assert manifest_data['name'] == 'Weather App'
+    assert manifest_data['short_name'] == 'Weather'
+    assert manifest_data['display'] == 'standalone'
+    assert manifest_data['theme_color'] == '#0078d4'
+    assert 'icons' in manifest_data
+    assert len(manifest_data['icons']) > 0
+
+
+def test_service_worker_accessible(client):
+    """Test that service worker file (sw.js) is accessible"""
+    response = client.get('/static/js/sw.js')
+    assert response.status_code == 200
+    # Content-type should be JavaScript (may include charset)
+    assert 'javascript' in response.content_type.lower()
+    
+    # Verify service worker contains key functionality
+    sw_content = response.get_data(as_text=True)
+    assert 'serviceWorker' in sw_content or 'Service Worker' in sw_content
+    assert 'install' in sw_content
+    assert 'fetch' in sw_content
+    assert 'activate' in sw_content
+
+
+def test_base_html_pwa_meta_tags(home_page):
+    """Test that base.html includes required PWA meta tags and manifest link"""
+    html_content = home_page
+    
+    # All required tags are found in a single scan of the page
+    found = set(PWA_META_PATTERN.findall(html_content))
+    assert PWA_META_NEEDLES - found == set()
+
+
+def test_service_worker_registration_script(home_page):
+    """Test that service worker registration script is present in base.html"""
+    html_content = home_page
+    
+    # Check for service worker registration script
+    assert "'serviceWorker' in navigator" in html_content or '"serviceWorker" in navigator' in html_content
+    assert 'navigator.serviceWorker.register' in html_content
+    assert '/static/js/sw.js' in html_content
+    assert 'SW registered' in html_content or 'registration.scope' in html_content
+    assert 'SW registration failed' in html_content or 'error' in html_content
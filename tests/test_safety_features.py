@@ -9,107 +9,69 @@ import pytest
 from services.safety_features import get_uv_info, get_aqi_info, get_alerts_info, enrich_weather_data
 
 
-def test_uv_info_low():
-    """Test UV index classification for low levels."""
-    current_data = {'uv': 1.5}
-    uv_info = get_uv_info(current_data)
-    
-    assert uv_info['value'] == 1.5
-    assert uv_info['level'] == 'Low'
-    assert uv_info['color'] == '#289500'
-    assert 'Minimal protection' in uv_info['recommendation']
-    assert uv_info['icon'] == '🟢'
-
-
-def test_uv_info_moderate():
-    """Test UV index classification for moderate levels."""
-    current_data = {'uv': 4}
-    uv_info = get_uv_info(current_data)
-    
-    assert uv_info['value'] == 4
-    assert uv_info['level'] == 'Moderate'
-    assert uv_info['color'] == '#F7E400'
-    assert 'SPF 30+' in uv_info['recommendation']
-
-
-def test_uv_info_high():
-    """Test UV index classification for high levels."""
-    current_data = {'uv': 6}
-    uv_info = get_uv_info(current_data)
-    
-    assert uv_info['value'] == 6
-    assert uv_info['level'] == 'High'
-    assert uv_info['color'] == '#F85900'
-
-
-def test_uv_info_very_high():
-    """Test UV index classification for very high levels."""
-    current_data = {'uv': 9}
-    uv_info = get_uv_info(current_data)
-    
-    assert uv_info['value'] == 9
-    assert uv_info['level'] == 'Very High'
-    assert uv_info['color'] == '#D8001D'
-
-
-def test_uv_info_extreme():
-    """Test UV index classification for extreme levels."""
-    current_data = {'uv': 12}
-    uv_info = get_uv_info(current_data)
-    
-    assert uv_info['value'] == 12
-    assert uv_info['level'] == 'Extreme'
-    assert uv_info['color'] == '#6B49C8'
-
-
-def test_aqi_info_good():
-    """Test AQI classification for good air quality."""
+# (uv, level, color, recommendation fragment, icon); None skips that check
+UV_CASES = [
+    pytest.param(1.5, 'Low', '#289500', 'Minimal protection', '🟢', id='low'),
+    pytest.param(4, 'Moderate', '#F7E400', 'SPF 30+', None, id='moderate'),
+    pytest.param(6, 'High', '#F85900', None, None, id='high'),
+    pytest.param(9, 'Very High', '#D8001D', None, None, id='very_high'),
+    pytest.param(12, 'Extreme', '#6B49C8', None, None, id='extreme'),
+]
+
+
+@pytest.mark.parametrize("uv,level,color,recommendation,icon", UV_CASES)
+def test_uv_info(uv, level, color, recommendation, icon):
+    """Test UV index classification for each level."""
+    uv_info = get_uv_info({'uv': uv})
+    
+    assert uv_info['value'] == uv
+    assert uv_info['level'] == level
+    assert uv_info['color'] == color
+    if recommendation is not None:
+        assert recommendation in uv_info['recommendation']
+    if icon is not None:
+        assert uv_info['icon'] == icon
+
+
+def test_uv_info_fractional_boundaries():
+    """Test that fractional UV values fall into the next band above each threshold."""
+    assert get_uv_info({'uv': 2.0})['level'] == 'Low'
+    assert get_uv_info({'uv': 2.5})['level'] == 'Moderate'
+    assert get_uv_info({'uv': 7.0})['level'] == 'High'
+    assert get_uv_info({'uv': 7.1})['level'] == 'Very High'
+    assert get_uv_info({'uv': 10.5})['level'] == 'Extreme'
+    assert get_uv_info({'uv': -1})['level'] == 'Low'
+
+
+# (epa index, pm2_5, pm10, level, color, guidance fragment); None skips that check
+AQI_CASES = [
+    pytest.param(1, 10.5, 20.3, 'Good', '#00E400', None, id='good'),
+    pytest.param(2, 25.0, 50.0, 'Moderate', None, 'sensitive people', id='moderate'),
+    pytest.param(3, 55.0, 100.0, 'Unhealthy for Sensitive Groups', '#FF7E00', None,
+                 id='unhealthy_sensitive'),
+]
+
+
+@pytest.mark.parametrize("index,pm2_5,pm10,level,color,guidance", AQI_CASES)
+def test_aqi_info(index, pm2_5, pm10, level, color, guidance):
+    """Test AQI classification for each air quality level."""
     current_data = {
         'air_quality': {
-            'us-epa-index': 1,
-            'pm2_5': 10.5,
-            'pm10': 20.3
+            'us-epa-index': index,
+            'pm2_5': pm2_5,
+            'pm10': pm10
         }
     }
     aqi_info = get_aqi_info(current_data)
     
-    assert aqi_info['value'] == 1
-    assert aqi_info['level'] == 'Good'
-    assert aqi_info['color'] == '#00E400'
-    assert aqi_info['pm2_5'] == 10.5
-    assert aqi_info['pm10'] == 20.3
-
-
-def test_aqi_info_moderate():
-    """Test AQI classification for moderate air quality."""
-    current_data = {
-        'air_quality': {
-            'us-epa-index': 2,
-            'pm2_5': 25.0,
-            'pm10': 50.0
-        }
-    }
-    aqi_info = get_aqi_info(current_data)
-    
-    assert aqi_info['value'] == 2
-    assert aqi_info['level'] == 'Moderate'
-    assert 'sensitive people' in aqi_info['guidance']
-
-
-def test_aqi_info_unhealthy_sensitive():
-    """Test AQI classification for unhealthy for sensitive groups."""
-    current_data = {
-        'air_quality': {
-            'us-epa-index': 3,
-            'pm2_5': 55.0,
-            'pm10': 100.0
-        }
-    }
-    aqi_info = get_aqi_info(current_data)
-    
-    assert aqi_info['value'] == 3
-    assert aqi_info['level'] == 'Unhealthy for Sensitive Groups'
-    assert aqi_info['color'] == '#FF7E00'
+    assert aqi_info['value'] == index
+    assert aqi_info['level'] == level
+    assert aqi_info['pm2_5'] == pm2_5
+    assert aqi_info['pm10'] == pm10
+    if color is not None:
+        assert aqi_info['color'] == color
+    if guidance is not None:
+        assert guidance in aqi_info['guidance']
 
 
 def test_aqi_info_no_data():
@@ -124,53 +86,49 @@ def test_aqi_info_no_data():
     assert aqi_info is None
 
 
-def test_alerts_info_with_alerts():
-    """Test alert parsing with active alerts."""
-    alerts_data = {
-        'alert': [
-            {
-                'headline': 'Severe Thunderstorm Warning',
-                'event': 'Thunderstorm',
-                'severity': 'severe',
-                'urgency': 'immediate',
-                'areas': 'County A, County B',
-                'desc': 'Severe thunderstorms expected.',
-                'instruction': 'Take shelter immediately.',
-                'effective': '2024-01-01T10:00:00',
-                'expires': '2024-01-01T18:00:00'
-            }
-        ]
-    }
-    alerts = get_alerts_info(alerts_data)
-    
-    assert len(alerts) == 1
-    assert alerts[0]['headline'] == 'Severe Thunderstorm Warning'
-    assert alerts[0]['severity'] == 'Severe'
-    assert alerts[0]['color'] == '#F85900'
-
-
-def test_alerts_info_extreme():
-    """Test alert parsing for extreme severity."""
-    alerts_data = {
-        'alert': [
-            {
-                'headline': 'Tornado Warning',
-                'event': 'Tornado',
-                'severity': 'extreme',
-                'urgency': 'immediate',
-                'areas': 'County C',
-                'desc': 'Tornado on the ground.',
-                'instruction': 'Take cover now!',
-                'effective': '2024-01-01T10:00:00',
-                'expires': '2024-01-01T11:00:00'
-            }
-        ]
-    }
-    alerts = get_alerts_info(alerts_data)
+# (alert, expected fields of the parsed alert)
+ALERT_CASES = [
+    pytest.param(
+        {
+            'headline': 'Severe Thunderstorm Warning',
+            'event': 'Thunderstorm',
+            'severity': 'severe',
+            'urgency': 'immediate',
+            'areas': 'County A, County B',
+            'desc': 'Severe thunderstorms expected.',
+            'instruction': 'Take shelter immediately.',
+            'effective': '2024-01-01T10:00:00',
+            'expires': '2024-01-01T18:00:00'
+        },
+        {'headline': 'Severe Thunderstorm Warning', 'severity': 'Severe', 'color': '#F85900'},
+        id='severe'
+    ),
+    pytest.param(
+        {
+            'headline': 'Tornado Warning',
+            'event': 'Tornado',
+            'severity': 'extreme',
+            'urgency': 'immediate',
+            'areas': 'County C',
+            'desc': 'Tornado on the ground.',
+            'instruction': 'Take cover now!',
+            'effective': '2024-01-01T10:00:00',
+            'expires': '2024-01-01T11:00:00'
+        },
+        {'color': '#D8001D', 'icon': '🔴'},  # Red for extreme
+        id='extreme'
+    ),
+]
+
+
+@pytest.mark.parametrize("alert,expected", ALERT_CASES)
+def test_alerts_info(alert, expected):
+    """Test alert parsing maps severity to its color and icon."""
+    alerts = get_alerts_info({'alert': [alert]})
     
     assert len(alerts) == 1
-    assert alerts[0]['color'] == '#D8001D'  # Red for extreme
-    assert alerts[0]['icon'] == '🔴'
+    for field, value in expected.items():
+        assert alerts[0][field] == value
 
 
 def test_alerts_info_no_alerts():
@@ -236,6 +194,8 @@ def test_enrich_weather_data_empty():
     enriched = enrich_weather_data(weather_data)
     
     assert 'uv_info' in enriched
+    # UV falls back to the Low level when current has no reading
+    assert enriched['uv_info']['level'] == "Low"
     # AQI should be None when no data
     assert enriched['aqi_info'] is None
     # Alerts should be empty list
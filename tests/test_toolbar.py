@@ -1,366 +1,170 @@
-#!/usr/bin/env python3
 """
-Comprehensive Toolbar Testing Suite for Weather App
-
-Tests all toolbar functionality including:
-- Location input and validation
-- Autocomplete functionality  
-- Location management (add/remove)
-- Bulk operations (refresh, clear all)
-- User preferences (temperature unit, view mode, auto-refresh)
-- Import/Export settings
-- UI state management
+Toolbar integration tests for the Weather App.
+
+Covers the search toolbar markup on the home page, the backend APIs it
+calls, its browser behaviour (Selenium), accessibility markers and page load. These talk to the app served
+on localhost:5000 (start it with `python main.py`) and are skipped when it
+isn't running.
+
+Selenium is imported only inside the browser fixture and tests, so collecting
+this module doesn't need it installed.
 """
 
-import requests
-import json
-import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import sys
-
-def setup_driver():
-    """Setup Chrome driver with appropriate options"""
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")  # Run in headless mode
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    
+import re
+import pytest
+
+# Key toolbar element IDs expected in the home page HTML (search bar and
+# the sections around it, rendered before any location is searched)
+TOOLBAR_IDS = (
+    'locationSearch',
+    'searchBtn',
+    'searchInputWrapper',
+    'autocompleteDropdown',
+    'autocompleteResults',
+    'themeToggle',
+    'recentCitiesSection'
+)
+
+# (attribute fragment, description) for the accessibility scan
+ACCESSIBILITY_CHECKS = (
+    ('aria-label', 'ARIA labels'),
+    ('placeholder=', 'Input field guidance'),
+    ('<fluent-', 'Fluent UI components (accessibility built-in)')
+)
+
+# Browser viewports for the responsive check: (width, height, device type)
+SCREEN_SIZES = (
+    (1920, 1080, 'Desktop'),
+    (768, 1024, 'Tablet'),
+    (375, 667, 'Mobile')
+)
+
+
+def _needle_pattern(needles):
+    """Compile needles into one alternation; the lookahead reports overlapping matches too."""
+    return re.compile('(?=(' + '|'.join(map(re.escape, needles)) + '))')
+
+
+# The home page is scanned once for all of its fragments
+_HOME_PAGE_RE = _needle_pattern(TOOLBAR_IDS + tuple(attr for attr, _ in ACCESSIBILITY_CHECKS))
+
+
+@pytest.fixture(scope='module')
+def home_page_fragments(session, live_server):
+    """Toolbar and accessibility fragments found on the home page."""
+    response = session.get(live_server)
+    assert response.status_code == 200
+    return set(_HOME_PAGE_RE.findall(response.text))
+
+
+@pytest.fixture(scope='module')
+def driver(live_server):
+    """One headless Chrome shared by the browser tests."""
     try:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+
+        chrome_options = Options()
+        chrome_options.add_argument("--headless")  # Run in headless mode
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--window-size=1920,1080")
+
         driver = webdriver.Chrome(options=chrome_options)
-        return driver
-    except Exception as e:
-        print(f"❌ Could not setup Chrome driver: {e}")
-        print("Note: This test requires Chrome/Chromium and ChromeDriver to be installed")
-        return None
-
-def test_toolbar_ui_elements():
-    """Test that all toolbar UI elements are present and accessible"""
-    print("\n🎯 Testing Toolbar UI Elements")
-    print("-" * 40)
-    
-    base_url = "http://localhost:5000"
-    
-    # Test with requests first (basic HTML structure)
-    try:
-        response = requests.get(base_url)
-        html_content = response.text
-        
-        # Check for key toolbar elements in HTML
-        toolbar_elements = [
-            'zipcode-toolbar',
-            'zipcodeInput',
-            'addLocationBtn', 
-            'currentLocationBtn',
-            'refreshBtn',
-            'moreActionsBtn',
-            'tempUnitToggle',
-            'viewToggle',
-            'autoRefreshToggle',
-            'locationBadges',
-            'autocompleteDropdown'
-        ]
-        
-        for element_id in toolbar_elements:
-            if element_id in html_content:
-                print(f"✅ Found toolbar element: {element_id}")
-            else:
-                print(f"❌ Missing toolbar element: {element_id}")
-                
-    except Exception as e:
-        print(f"❌ Error testing toolbar UI elements: {e}")
-
-def test_toolbar_api_integration():
-    """Test toolbar's integration with backend APIs"""
-    print("\n🔗 Testing Toolbar API Integration")
-    print("-" * 40)
-    
-    base_url = "http://localhost:5000"
-    
-    # Test location validation API (used by toolbar)
-    print("1. Testing location validation API...")
-    try:
-        response = requests.get(f"{base_url}/api/validate-location?location=10001")
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✅ Location validation API: {data.get('valid', False)}")
-        else:
-            print(f"❌ Location validation API failed: {response.status_code}")
-    except Exception as e:
-        print(f"❌ Location validation API error: {e}")
-    
-    # Test location search API (used by autocomplete)
-    print("2. Testing location search API...")
-    try:
-        response = requests.get(f"{base_url}/api/search-locations?q=New")
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✅ Location search API: {len(data)} results")
-        else:
-            print(f"❌ Location search API failed: {response.status_code}")
     except Exception as e:
-        print(f"❌ Location search API error: {e}")
-    
-    # Test bulk weather API (used by refresh functionality)
-    print("3. Testing bulk weather API...")
-    try:
-        payload = {
-            "locations": ["New York", "London"],
-            "tempUnit": "celsius"
-        }
-        response = requests.post(f"{base_url}/api/weather/bulk",
-                               json=payload,
-                               headers={'Content-Type': 'application/json'})
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✅ Bulk weather API: {len(data)} locations processed")
-        else:
-            print(f"❌ Bulk weather API failed: {response.status_code}")
-    except Exception as e:
-        print(f"❌ Bulk weather API error: {e}")
-
-def test_toolbar_javascript_functions():
-    """Test toolbar JavaScript functions using browser automation"""
-    print("\n🚀 Testing Toolbar JavaScript Functions")
-    print("-" * 40)
-    
-    driver = setup_driver()
-    if not driver:
-        print("⚠️ Skipping JavaScript tests - Chrome driver not available")
-        return
-    
+        pytest.skip(f"Chrome driver not available (needs Chrome/Chromium and ChromeDriver): {e}")
+    yield driver
+    driver.quit()
+
+
+# UI Element Tests
+@pytest.mark.parametrize('element_id', TOOLBAR_IDS)
+def test_toolbar_ui_element(home_page_fragments, element_id):
+    """Test that each toolbar element is present in the page HTML"""
+    assert element_id in home_page_fragments
+
+
+@pytest.mark.parametrize('attr', [attr for attr, _ in ACCESSIBILITY_CHECKS],
+                         ids=[description for _, description in ACCESSIBILITY_CHECKS])
+def test_toolbar_accessibility(home_page_fragments, attr):
+    """Test that the page carries each accessibility marker"""
+    assert attr in home_page_fragments
+
+
+# API Integration Tests
+def test_location_validation_api(session, live_server):
+    """Test the location validation API used by the toolbar"""
+    response = session.get(f"{live_server}/api/validate-location", params={'location': '10001'})
+    assert response.status_code == 200
+    assert 'valid' in response.json()
+
+
+def test_location_search_api(session, live_server):
+    """Test the location search API used by autocomplete"""
+    response = session.get(f"{live_server}/api/search-locations", params={'q': 'New'})
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
+
+
+def test_bulk_weather_api(session, live_server):
+    """Test the bulk weather API used by refresh"""
+    locations = ['New York', 'London']
+    response = session.post(f"{live_server}/api/weather/bulk",
+                            json={'locations': locations, 'tempUnit': 'celsius'})
+    assert response.status_code == 200
+    assert len(response.json()) == len(locations)
+
+
+# Browser Tests
+def test_toolbar_javascript_functions(driver, live_server):
+    """Test toolbar elements are interactive in a real browser"""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    driver.get(live_server)
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located((By.ID, "locationSearch"))
+    )
+
+    assert driver.find_element(By.ID, "searchBtn").is_enabled()
+
+    # find_element raises NoSuchElementException for a missing element
+    for element_id in ("themeToggle", "autocompleteDropdown", "autocompleteResults"):
+        driver.find_element(By.ID, element_id)
+
+
+@pytest.mark.parametrize('width,height,device_type', SCREEN_SIZES,
+                         ids=[device_type for _, _, device_type in SCREEN_SIZES])
+def test_toolbar_responsive_design(driver, live_server, width, height, device_type):
+    """Test the toolbar stays visible at each screen size"""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    # Switch the viewport in place; the page is only loaded if needed
+    driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+        "width": width,
+        "height": height,
+        "deviceScaleFactor": 1,
+        "mobile": width < 768
+    })
     try:
-        base_url = "http://localhost:5000"
-        driver.get(base_url)
-        
-        # Wait for page to load
-        WebDriverWait(driver, 10).wait(
-            EC.presence_of_element_located((By.CLASS_NAME, "zipcode-toolbar"))
+        if not driver.current_url.startswith(live_server):
+            driver.get(live_server)
+        toolbar = WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CLASS_NAME, "search-bar-container"))
         )
-        
-        print("✅ Page loaded successfully")
-        
-        # Test 1: Check if location input field is functional
-        try:
-            location_input = driver.find_element(By.ID, "zipcodeInput")
-            location_input.clear()
-            location_input.send_keys("10001")
-            print("✅ Location input field is functional")
-        except NoSuchElementException:
-            print("❌ Location input field not found")
-        
-        # Test 2: Check if add location button is present and clickable
-        try:
-            add_btn = driver.find_element(By.ID, "addLocationBtn")
-            if add_btn.is_enabled():
-                print("✅ Add location button is enabled")
-            else:
-                print("⚠️ Add location button is disabled")
-        except NoSuchElementException:
-            print("❌ Add location button not found")
-        
-        # Test 3: Check if current location button is present
-        try:
-            current_btn = driver.find_element(By.ID, "currentLocationBtn")
-            print("✅ Current location button found")
-        except NoSuchElementException:
-            print("❌ Current location button not found")
-        
-        # Test 4: Check if refresh button is present
-        try:
-            refresh_btn = driver.find_element(By.ID, "refreshBtn")
-            print("✅ Refresh button found")
-        except NoSuchElementException:
-            print("❌ Refresh button not found")
-        
-        # Test 5: Check if user preference toggles are present
-        preference_toggles = ["tempUnitToggle", "viewToggle", "autoRefreshToggle"]
-        for toggle_id in preference_toggles:
-            try:
-                toggle = driver.find_element(By.ID, toggle_id)
-                print(f"✅ {toggle_id} found")
-            except NoSuchElementException:
-                print(f"❌ {toggle_id} not found")
-        
-        # Test 6: Check if location badges container is present
-        try:
-            badges_container = driver.find_element(By.ID, "locationBadges")
-            print("✅ Location badges container found")
-        except NoSuchElementException:
-            print("❌ Location badges container not found")
-        
-        # Test 7: Check if autocomplete dropdown is present
-        try:
-            autocomplete = driver.find_element(By.ID, "autocompleteDropdown")
-            print("✅ Autocomplete dropdown found")
-        except NoSuchElementException:
-            print("❌ Autocomplete dropdown not found")
-        
-        print("✅ All basic JavaScript elements are accessible")
-        
-    except TimeoutException:
-        print("❌ Page failed to load properly")
-    except Exception as e:
-        print(f"❌ Error during JavaScript testing: {e}")
-    finally:
-        driver.quit()
-
-def test_toolbar_accessibility():
-    """Test toolbar accessibility features"""
-    print("\n♿ Testing Toolbar Accessibility")
-    print("-" * 40)
-    
-    base_url = "http://localhost:5000"
-    
-    try:
-        response = requests.get(base_url)
-        html_content = response.text
-        
-        # Check for accessibility attributes
-        accessibility_checks = [
-            ('aria-label', 'ARIA labels'),
-            ('role=', 'ARIA roles'),
-            ('tabindex', 'Tab navigation'),
-            ('alt=', 'Alt text for images'),
-            ('<fluent-', 'Fluent UI components (accessibility built-in)')
-        ]
-        
-        for attr, description in accessibility_checks:
-            if attr in html_content:
-                print(f"✅ Found {description}")
-            else:
-                print(f"⚠️ May be missing {description}")
-                
-    except Exception as e:
-        print(f"❌ Error testing accessibility: {e}")
-
-def test_toolbar_responsive_design():
-    """Test toolbar responsive design"""
-    print("\n📱 Testing Toolbar Responsive Design")
-    print("-" * 40)
-    
-    driver = setup_driver()
-    if not driver:
-        print("⚠️ Skipping responsive design tests - Chrome driver not available")
-        return
-    
-    try:
-        base_url = "http://localhost:5000"
-        
-        # Test different screen sizes
-        screen_sizes = [
-            (1920, 1080, "Desktop"),
-            (768, 1024, "Tablet"),
-            (375, 667, "Mobile")
-        ]
-        
-        for width, height, device_type in screen_sizes:
-            driver.set_window_size(width, height)
-            driver.get(base_url)
-            
-            # Wait for page to load
-            WebDriverWait(driver, 10).wait(
-                EC.presence_of_element_located((By.CLASS_NAME, "zipcode-toolbar"))
-            )
-            
-            # Check if toolbar is visible and accessible
-            try:
-                toolbar = driver.find_element(By.CLASS_NAME, "zipcode-toolbar")
-                if toolbar.is_displayed():
-                    print(f"✅ Toolbar visible on {device_type} ({width}x{height})")
-                else:
-                    print(f"❌ Toolbar not visible on {device_type} ({width}x{height})")
-            except NoSuchElementException:
-                print(f"❌ Toolbar not found on {device_type} ({width}x{height})")
-        
-    except Exception as e:
-        print(f"❌ Error testing responsive design: {e}")
+        assert toolbar.is_displayed(), f"Toolbar not visible on {device_type} ({width}x{height})"
     finally:
-        driver.quit()
-
-def test_toolbar_performance():
-    """Test toolbar performance metrics"""
-    print("\n⚡ Testing Toolbar Performance")
-    print("-" * 40)
-    
-    base_url = "http://localhost:5000"
-    
-    # Test page load time
-    start_time = time.time()
-    try:
-        response = requests.get(base_url, timeout=10)
-        load_time = time.time() - start_time
-        
-        if response.status_code == 200:
-            print(f"✅ Page loaded in {load_time:.2f} seconds")
-            
-            # Check page size
-            content_size = len(response.content) / 1024  # KB
-            print(f"📊 Page size: {content_size:.2f} KB")
-            
-            if load_time < 3.0:
-                print("✅ Page load time is acceptable (< 3s)")
-            else:
-                print("⚠️ Page load time may be slow (> 3s)")
-                
-        else:
-            print(f"❌ Page failed to load: {response.status_code}")
-            
-    except requests.exceptions.Timeout:
-        print("❌ Page load timed out (> 10s)")
-    except Exception as e:
-        print(f"❌ Error testing performance: {e}")
-
-def main():
-    """Main test function"""
-    print("🧪 Weather App - Comprehensive Toolbar Testing Suite")
-    print("=" * 60)
-    
-    # Check if server is running
-    try:
-        response = requests.get("http://localhost:5000", timeout=5)
-        print("✅ Server is running and accessible")
-    except Exception as e:
-        print("❌ Server is not running or not accessible")
-        print("Please make sure the Flask app is running on localhost:5000")
-        sys.exit(1)
-    
-    # Run all toolbar tests
-    test_toolbar_ui_elements()
-    test_toolbar_api_integration()
-    test_toolbar_javascript_functions()
-    test_toolbar_accessibility()
-    test_toolbar_responsive_design()
-    test_toolbar_performance()
-    
-    print("\n" + "=" * 60)
-    print("🎉 Toolbar Testing Complete!")
-    print("\n📋 Test Summary:")
-    print("• UI Elements: Basic HTML structure and element presence")
-    print("• API Integration: Backend API endpoints used by toolbar")
-    print("• JavaScript Functions: Interactive elements and functionality")
-    print("• Accessibility: ARIA attributes and semantic markup")
-    print("• Responsive Design: Multi-device compatibility")
-    print("• Performance: Load times and resource usage")
-    
-    print("\n🔧 Manual Testing Recommendations:")
-    print("1. Open http://localhost:5000 in your browser")
-    print("2. Try adding locations using different input methods:")
-    print("   - ZIP codes (e.g., 10001, 90210)")
-    print("   - City names (e.g., New York, London)")
-    print("   - Coordinates (if supported)")
-    print("3. Test autocomplete functionality by typing partial city names")
-    print("4. Toggle between Celsius/Fahrenheit")
-    print("5. Switch between grid/table view modes")
-    print("6. Test auto-refresh toggle")
-    print("7. Try bulk operations (Refresh All, Clear All)")
-    print("8. Test import/export settings")
-
-if __name__ == "__main__":
-    main()
+        # Restore the default viewport for later tests sharing the driver
+        driver.execute_cdp_cmd("Emulation.clearDeviceMetricsOverride", {})
+
+
+# Performance Tests
+def test_toolbar_performance(session, live_server):
+    """Test the page loads within the timeout"""
+    response = session.get(live_server, timeout=10)
+    assert response.status_code == 200
+    assert response.content
@@ -1,332 +0,0 @@
-#!/usr/bin/env python3
-"""
-Toolbar Functional Test - Interactive Testing Guide
-
-This script provides a structured approach to test toolbar functionality
-by guiding manual testing and validating API responses.
-"""
-
-import requests
-import json
-import sys
-
-def test_location_input_scenarios():
-    """Test various location input scenarios"""
-    print("🗺️ Testing Location Input Scenarios")
-    print("=" * 50)
-    
-    base_url = "http://localhost:5000"
-    
-    # Test scenarios for location input
-    test_cases = [
-        # ZIP Codes
-        {"input": "10001", "type": "ZIP Code", "expected": "Valid"},
-        {"input": "90210", "type": "ZIP Code", "expected": "Valid"},
-        {"input": "00000", "type": "Invalid ZIP", "expected": "Invalid"},
-        
-        # City Names
-        {"input": "New York", "type": "City Name", "expected": "Valid"},
-        {"input": "London", "type": "City Name", "expected": "Valid"},
-        {"input": "Paris", "type": "City Name", "expected": "Valid"},
-        {"input": "Tokyo", "type": "City Name", "expected": "Valid"},
-        
-        # Partial names (for autocomplete)
-        {"input": "New", "type": "Partial City", "expected": "Suggestions"},
-        {"input": "Lon", "type": "Partial City", "expected": "Suggestions"},
-        {"input": "Par", "type": "Partial City", "expected": "Suggestions"},
-        
-        # Edge cases
-        {"input": "", "type": "Empty Input", "expected": "Invalid"},
-        {"input": "XYZ123", "type": "Invalid Location", "expected": "Invalid"},
-    ]
-    
-    for i, test_case in enumerate(test_cases, 1):
-        print(f"\n{i}. Testing {test_case['type']}: '{test_case['input']}'")
-        
-        if test_case['expected'] == "Suggestions":
-            # Test search API for autocomplete
-            try:
-                response = requests.get(f"{base_url}/api/search-locations?q={test_case['input']}")
-                if response.status_code == 200:
-                    data = response.json()
-                    print(f"   ✅ Found {len(data)} suggestions")
-                    for j, suggestion in enumerate(data[:3]):  # Show first 3
-                        print(f"      {j+1}. {suggestion.get('display', 'N/A')}")
-                else:
-                    print(f"   ❌ API Error: {response.status_code}")
-            except Exception as e:
-                print(f"   ❌ Error: {e}")
-        else:
-            # Test validation API
-            try:
-                response = requests.get(f"{base_url}/api/validate-location?location={test_case['input']}")
-                if response.status_code == 200:
-                    data = response.json()
-                    is_valid = data.get('valid', False)
-                    expected_valid = test_case['expected'] == "Valid"
-                    
-                    if is_valid == expected_valid:
-                        print(f"   ✅ Result: {'Valid' if is_valid else 'Invalid'} (as expected)")
-                    else:
-                        print(f"   ⚠️ Result: {'Valid' if is_valid else 'Invalid'} (expected {test_case['expected']})")
-                else:
-                    print(f"   ❌ API Error: {response.status_code}")
-            except Exception as e:
-                print(f"   ❌ Error: {e}")
-
-def test_bulk_operations():
-    """Test bulk operations like refresh all"""
-    print("\n📊 Testing Bulk Operations")
-    print("=" * 50)
-    
-    base_url = "http://localhost:5000"
-    
-    # Test scenarios for bulk operations
-    bulk_scenarios = [
-        {
-            "name": "Single Location",
-            "locations": ["New York"],
-            "tempUnit": "celsius"
-        },
-        {
-            "name": "Multiple Cities",
-            "locations": ["New York", "London", "Tokyo"],
-            "tempUnit": "fahrenheit"
-        },
-        {
-            "name": "Mixed Input Types",
-            "locations": ["10001", "London", "Paris"],
-            "tempUnit": "celsius"
-        },
-        {
-            "name": "Many Locations (Stress Test)",
-            "locations": ["New York", "London", "Tokyo", "Paris", "Berlin", "Sydney", "Toronto", "Miami"],
-            "tempUnit": "celsius"
-        }
-    ]
-    
-    for i, scenario in enumerate(bulk_scenarios, 1):
-        print(f"\n{i}. Testing {scenario['name']}:")
-        print(f"   Locations: {', '.join(scenario['locations'])}")
-        print(f"   Temperature Unit: {scenario['tempUnit']}")
-        
-        try:
-            payload = {
-                "locations": scenario['locations'],
-                "tempUnit": scenario['tempUnit']
-            }
-            
-            response = requests.post(f"{base_url}/api/weather/bulk",
-                                   json=payload,
-                                   headers={'Content-Type': 'application/json'})
-            
-            if response.status_code == 200:
-                data = response.json()
-                print(f"   ✅ Successfully processed {len(data)} locations")
-                
-                for location_data in data:
-                    location_name = location_data.get('location', {}).get('name', 'Unknown')
-                    current = location_data.get('current', {})
-                    temp_key = 'temp_c' if scenario['tempUnit'] == 'celsius' else 'temp_f'
-                    temp = current.get(temp_key, 'N/A')
-                    condition = current.get('condition', {}).get('text', 'N/A')
-                    unit = '°C' if scenario['tempUnit'] == 'celsius' else '°F'
-                    
-                    print(f"      📍 {location_name}: {temp}{unit}, {condition}")
-            else:
-                print(f"   ❌ API Error: {response.status_code}")
-                try:
-                    error_data = response.json()
-                    print(f"      Error: {error_data.get('error', 'Unknown error')}")
-                except:
-                    pass
-                    
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-
-def test_user_preferences():
-    """Test user preference scenarios"""
-    print("\n⚙️ Testing User Preferences")
-    print("=" * 50)
-    
-    base_url = "http://localhost:5000"
-    
-    # Test temperature unit preferences
-    print("1. Testing Temperature Unit Preferences:")
-    
-    locations = ["New York", "London"]
-    units = [("celsius", "°C"), ("fahrenheit", "°F")]
-    
-    for unit, symbol in units:
-        print(f"\n   Testing {unit} ({symbol}):")
-        try:
-            payload = {
-                "locations": locations,
-                "tempUnit": unit
-            }
-            
-            response = requests.post(f"{base_url}/api/weather/bulk",
-                                   json=payload,
-                                   headers={'Content-Type': 'application/json'})
-            
-            if response.status_code == 200:
-                data = response.json()
-                for location_data in data:
-                    location_name = location_data.get('location', {}).get('name', 'Unknown')
-                    current = location_data.get('current', {})
-                    temp_key = 'temp_c' if unit == 'celsius' else 'temp_f'
-                    temp = current.get(temp_key, 'N/A')
-                    print(f"      {location_name}: {temp}{symbol}")
-                print(f"   ✅ {unit.capitalize()} unit working correctly")
-            else:
-                print(f"   ❌ Error with {unit}: {response.status_code}")
-        except Exception as e:
-            print(f"   ❌ Error testing {unit}: {e}")
-
-def test_forecast_integration():
-    """Test toolbar integration with forecast pages"""
-    print("\n🔮 Testing Forecast Integration")
-    print("=" * 50)
-    
-    base_url = "http://localhost:5000"
-    
-    # Test different forecast page access patterns
-    forecast_tests = [
-        {"url": "/forecast", "description": "Default forecast page"},
-        {"url": "/forecast?zip=10001", "description": "Forecast with ZIP parameter"},
-        {"url": "/forecast?location=London", "description": "Forecast with location parameter"},
-    ]
-    
-    for test in forecast_tests:
-        print(f"\nTesting {test['description']}:")
-        try:
-            response = requests.get(f"{base_url}{test['url']}")
-            if response.status_code == 200:
-                print("   ✅ Page loads successfully")
-                
-                # Check for toolbar presence
-                if 'zipcode-toolbar' in response.text:
-                    print("   ✅ Toolbar is present on page")
-                else:
-                    print("   ⚠️ Toolbar may not be visible")
-                
-                # Check for key elements
-                key_elements = ['weather-grid', 'location-badges', 'refreshBtn']
-                for element in key_elements:
-                    if element in response.text:
-                        print(f"   ✅ Element found: {element}")
-                    else:
-                        print(f"   ⚠️ Element may be missing: {element}")
-            else:
-                print(f"   ❌ Page load failed: {response.status_code}")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-
-def generate_manual_test_checklist():
-    """Generate a comprehensive manual testing checklist"""
-    print("\n📋 Manual Testing Checklist")
-    print("=" * 50)
-    
-    checklist = [
-        {
-            "category": "🗺️ Location Input",
-            "tests": [
-                "Enter a ZIP code (e.g., 10001) and verify it's accepted",
-                "Enter a city name (e.g., New York) and verify it's accepted", 
-                "Type partial city name and verify autocomplete suggestions appear",
-                "Select a suggestion from autocomplete dropdown",
-                "Try entering an invalid location and verify error handling"
-            ]
-        },
-        {
-            "category": "🔘 Control Buttons",
-            "tests": [
-                "Click 'Add Location' button and verify location is added",
-                "Click 'Current Location' button and verify geolocation works",
-                "Click 'Refresh All' button and verify all data updates",
-                "Test 'More Actions' menu functionality",
-                "Verify location badges appear with remove buttons"
-            ]
-        },
-        {
-            "category": "⚙️ User Preferences",
-            "tests": [
-                "Toggle temperature unit (°C/°F) and verify display changes",
-                "Toggle view mode (Grid/Table) and verify layout changes",
-                "Toggle auto-refresh and verify countdown appears/disappears",
-                "Test import/export settings functionality"
-            ]
-        },
-        {
-            "category": "📊 Data Management",
-            "tests": [
-                "Add multiple locations and verify they all display",
-                "Remove individual locations using badge close buttons",
-                "Use 'Clear All Locations' and verify all are removed",
-                "Verify location counter updates correctly (X/10 locations)"
-            ]
-        },
-        {
-            "category": "🎨 Visual & UX",
-            "tests": [
-                "Verify Fluent UI components render correctly",
-                "Test responsive behavior on different screen sizes",
-                "Verify loading states and status indicators work",
-                "Check that icons display properly",
-                "Verify color scheme and contrast"
-            ]
-        },
-        {
-            "category": "⚡ Performance",
-            "tests": [
-                "Add 10 locations and verify performance remains good",
-                "Test auto-refresh with multiple locations",
-                "Verify API calls don't cause UI freezing",
-                "Check memory usage with extended use"
-            ]
-        }
-    ]
-    
-    for category_data in checklist:
-        print(f"\n{category_data['category']}")
-        for i, test in enumerate(category_data['tests'], 1):
-            print(f"   {i}. [ ] {test}")
-    
-    print(f"\n🌐 Access the application at: http://localhost:5000")
-    print("✅ Check each item above while using the toolbar interface")
-
-def main():
-    """Main test coordinator"""
-    print("🧪 Weather App - Toolbar Functional Testing")
-    print("=" * 60)
-    
-    # Check server availability
-    try:
-        response = requests.get("http://localhost:5000", timeout=5)
-        print("✅ Server is running and accessible")
-    except Exception as e:
-        print("❌ Server is not accessible")
-        print("Please ensure the Flask app is running on localhost:5000")
-        sys.exit(1)
-    
-    # Run automated tests
-    test_location_input_scenarios()
-    test_bulk_operations()
-    test_user_preferences()
-    test_forecast_integration()
-    
-    # Generate manual testing guide
-    generate_manual_test_checklist()
-    
-    print("\n" + "=" * 60)
-    print("🎉 Toolbar Testing Complete!")
-    print("\n📈 Test Results Summary:")
-    print("✅ Location input validation working correctly")
-    print("✅ Autocomplete suggestions functioning")
-    print("✅ Bulk weather operations successful")
-    print("✅ Temperature unit preferences working")
-    print("✅ Forecast page integration verified")
-    print("\n🔍 Next: Complete the manual testing checklist above!")
-
-if __name__ == "__main__":
-    main()
@@ -0,0 +1,310 @@
+"""
+Tests for the WeatherAPI.com provider.
+"""
+
+import threading
+import time
+import pytest
+import requests
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from services.weather_service import APIRequestError
+from services.weatherapi_provider import (
+    WeatherAPIProvider, REQUEST_TIMEOUT, HTTP_POOL_SIZE
+)
+from tests.conftest import UpstreamResponse
+
+
+SEARCH_PAYLOAD = [
+    {'name': 'San Francisco', 'region': 'California', 'country': 'USA'},
+    {'name': 'San Diego', 'region': 'California', 'country': 'USA'},
+    {'name': 'San Jose', 'region': 'California', 'country': 'USA'},
+]
+
+
+@pytest.fixture
+def provider():
+    return WeatherAPIProvider(api_key='test_api_key')
+
+
+def _past_dates(days):
+    today = datetime.now()
+    return [(today - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(1, days + 1)]
+
+
+@patch('services.weatherapi_provider.requests.Session.get')
+def test_search_normalized_repeat_is_cached(mock_get, provider):
+    """Test that a repeat differing only in case and whitespace is served from cache."""
+    mock_get.return_value = UpstreamResponse(SEARCH_PAYLOAD)
+
+    results = provider.search_locations('San')
+    assert len(results) == 3
+
+    results = provider.search_locations('  san ')
+    assert len(results) == 3
+    assert mock_get.call_count == 1
+
+
+@patch('services.weatherapi_provider.requests.Session.get')
+def test_search_longer_query_calls_api(mock_get, provider):
+    """Test that a longer query is sent upstream rather than filtered locally."""
+    mock_get.return_value = UpstreamResponse(SEARCH_PAYLOAD)
+    provider.search_locations('San')
+
+    mock_get.return_value = UpstreamResponse([
+        {'name': 'Santa Fe', 'region': 'New Mexico', 'country': 'USA'}
+    ])
+    results = provider.search_locations('San F')
+
+    assert [r.name for r in results] == ['Santa Fe']
+    assert mock_get.call_count == 2
+
+
+@patch('services.weatherapi_provider.requests.Session.get')
+def test_search_respects_limit(mock_get, provider):
+    """Test that search results are capped at the limit."""
+    mock_get.return_value = UpstreamResponse(SEARCH_PAYLOAD)
+
+    results = provider.search_locations('San', limit=2)
+    assert len(results) == 2
+
+
+@patch('services.weatherapi_provider.requests.Session.get')
+def test_search_ignores_whitespace_padded_short_query(mock_get, provider):
+    """Test that the minimum length applies to the stripped query."""
+    assert provider.search_locations(' a  ') == []
+    mock_get.assert_not_called()
+
+
+def _history_day_response(params):
+    """Per-day history response; date ranges are rejected like a free-tier key."""
+    if 'end_dt' in params:
+        return UpstreamResponse(None)
+    return UpstreamResponse({'dt': params['dt']})
+
+
+@patch('services.weatherapi_provider.requests.Session.get')
+def test_history_uses_single_range_request(mock_get, provider):
+    """Test that history is fetched with one date-range request when supported."""
+    dates = _past_dates(7)
+    mock_get.return_value = UpstreamResponse({
+        'location': {'name': 'London'},
+        'forecast': {'forecastday': [{'date': d} for d in reversed(dates)]}
+    })
+
+    history = provider._get_history('London', days=7)
+
+    assert mock_get.call_count == 1
+    params = mock_get.call_args.kwargs['params']
+    assert (params['dt'], params['end_dt']) == (dates[-1], dates[0])
+    assert [day['forecast']['forecastday'][0]['date'] for day in history] == dates
+    assert all(day['location'] == {'name': 'London'} for day in history)
+
+
+@patch('services.weatherapi_provider.requests.Session.get')
+def test_history_falls_back_to_per_day_requests(mock_get, provider):
+    """Test that a rejected range request falls back to per-day requests once."""
+    mock_get.side_effect = lambda url, params=None, **kwargs: _history_day_response(params)
+
+    history = provider._get_history('London', days=7)
+
+    assert mock_get.call_count == 8
+    assert [day['dt'] for day in history] == _past_dates(7)
+
+    # The rejected range is remembered; later fetches go straight to per-day
+    provider._get_history('Paris', days=7)
+    assert mock_get.call_count == 15
+
+
+@patch('services.weatherapi_provider.requests.Session.get')
+def test_history_falls_back_when_range_is_partial(mock_get, provider):
+    """Test that a range response covering only the dt day falls back to per-day requests."""
+    def fake_get(url, params=None, **kwargs):
+        if 'end_dt' in params:
+            # end_dt ignored: only the start day comes back
+            return UpstreamResponse({
+                'location': {'name': 'London'},
+                'forecast': {'forecastday': [{'date': params['dt']}]}
+            })
+        return UpstreamResponse({'dt': params['dt']})
+
+    mock_get.side_effect = fake_get
+
+    history = provider._get_history('London', days=7)
+
+    assert mock_get.call_count == 8
+    assert [day['dt'] for day in history] == _past_dates(7)
+    assert provider._history_range_supported is False
+
+
+@patch('services.weatherapi_provider.requests.Session.get')
+def test_history_tolerates_failed_days(mock_get, provider):
+    """Test that a failing history request does not drop the other days."""
+    dates = _past_dates(3)
+
+    def fake_get(url, params=None, **kwargs):
+        if params.get('dt') == dates[1] and 'end_dt' not in params:
+            raise requests.exceptions.ConnectionError('boom')
+        return _history_day_response(params)
+
+    mock_get.side_effect = fake_get
+
+    history = provider._get_history('London', days=3)
+
+    assert [day['dt'] for day in history] == [dates[0], dates[2]]
+
+
+@patch('services.weatherapi_provider.requests.Session.get')
+def test_requests_use_shared_session_with_timeout(mock_get, provider):
+    """Test that upstream calls go through the pooled session with a timeout."""
+    mock_get.return_value = UpstreamResponse({'location': {'name': 'London'}})
+
+    provider.validate_location('London')
+    provider.get_current_weather('London')
+
+    assert mock_get.call_count == 2
+    for call in mock_get.call_args_list:
+        assert call.kwargs['timeout'] == REQUEST_TIMEOUT
+
+
+def _forecast_get(url, params=None, **kwargs):
+    """forecast.json returns the requested number of days; history finds nothing."""
+    if url.endswith('forecast.json'):
+        return UpstreamResponse({
+            'location': {'name': 'London'},
+            'current': {'temp_c': 10},
+            'forecast': {'forecastday': [{'date': f'day{i}'} for i in range(params['days'])]}
+        })
+    return UpstreamResponse(None)
+
+
+def _forecast_calls(mock_get):
+    return [call for call in mock_get.call_args_list if call.args[0].endswith('forecast.json')]
+
+
+@patch('services.weatherapi_provider.requests.Session.get')
+def test_bulk_weather_fetches_each_uncached_location_once(mock_get, provider):
+    """Test that bulk weather serves cache hits and de-duplicates misses."""
+    def fake_get(url, params=None, **kwargs):
+        return UpstreamResponse({'location': {'name': params['q']}, 'forecast': {}})
+
+    mock_get.side_effect = fake_get
+    provider.get_weather_data('London')
+
+    results = provider.get_bulk_weather(['London', 'Paris', 'paris ', 'London'])
+
+    assert [r['location']['name'] for r in results] == ['London', 'Paris', 'Paris', 'London']
+    forecast_queries = [
+        call.kwargs['params']['q'] for call in mock_get.call_args_list
+        if call.args[0].endswith('forecast.json')
+    ]
+    assert forecast_queries == ['London', 'Paris']
+
+
+@patch('services.weatherapi_provider.requests.Session.get')
+def test_bulk_weather_caps_concurrent_upstream_requests(mock_get, provider):
+    """Test that nested bulk and per-day history pools stay within the connection pool."""
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def fake_get(url, params=None, **kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        if url.endswith('forecast.json'):
+            return UpstreamResponse({'location': {'name': params['q']}, 'forecast': {}})
+        return _history_day_response(params)
+
+    mock_get.side_effect = fake_get
+    provider._history_range_supported = False
+
+    provider.get_bulk_weather([f'City {i}' for i in range(8)])
+
+    assert mock_get.call_count == 8 * 8
+    assert peak <= HTTP_POOL_SIZE
+
+
+@patch('services.weatherapi_provider.requests.Session.get')
+def test_weather_data_requests_only_summary_days(mock_get, provider):
+    """Test that the home page asks forecast.json for the 3 days it shows."""
+    mock_get.side_effect = _forecast_get
+
+    weather = provider.get_weather_data('London')
+
+    assert len(weather['forecast']['forecastday']) == 3
+    assert [call.kwargs['params']['days'] for call in _forecast_calls(mock_get)] == [3]
+
+
+@patch('services.weatherapi_provider.requests.Session.get')
+def test_weather_data_reuses_cached_detailed_forecast(mock_get, provider):
+    """Test that the home page slices a cached 10-day forecast without sharing its dicts."""
+    mock_get.side_effect = _forecast_get
+
+    detailed = provider.get_detailed_forecast('London', days=5)
+    weather = provider.get_weather_data('London')
+
+    assert len(detailed['forecast']['forecastday']) == 5
+    assert len(detailed['astronomy']) == 5
+    assert len(weather['forecast']['forecastday']) == 3
+    assert [call.kwargs['params']['days'] for call in _forecast_calls(mock_get)] == [10]
+
+    weather['current']['uv_info'] = 'enriched'
+    weather['forecast']['forecastday'][0]['astro'] = 'enriched'
+    assert 'uv_info' not in detailed['current']
+    assert 'astro' not in detailed['forecast']['forecastday'][0]
+
+
+@patch('services.weatherapi_provider.requests.Session.get')
+def test_validate_location_caches_not_found(mock_get, provider):
+    """Test that a location reported as not found is not re-queried right away."""
+    mock_get.return_value = UpstreamResponse(status_code=400)
+
+    assert provider.validate_location('Nowhereville') == (False, None)
+    assert provider.validate_location('nowhereville ') == (False, None)
+    assert mock_get.call_count == 1
+
+
+@patch('services.weatherapi_provider.requests.Session.get')
+def test_validate_location_does_not_cache_request_errors(mock_get, provider):
+    """Test that network failures are retried on the next validation."""
+    mock_get.side_effect = requests.exceptions.ConnectionError('boom')
+
+    assert provider.validate_location('London') == (False, None)
+    assert provider.validate_location('London') == (False, None)
+    assert mock_get.call_count == 2
+
+
+@patch('services.weatherapi_provider.requests.Session.get')
+def test_make_request_does_not_mutate_params(mock_get, provider):
+    """Test that the API key is added to a copy of the caller's params."""
+    mock_get.return_value = UpstreamResponse({'location': {'name': 'London'}})
+    params = {'q': 'London'}
+
+    provider._make_request('current.json', params)
+
+    assert params == {'q': 'London'}
+    assert mock_get.call_args.kwargs['params'] == {'q': 'London', 'key': 'test_api_key'}
+
+
+@patch('services.weatherapi_provider.requests.Session.get')
+def test_make_request_returns_none_for_bad_query_without_raising(mock_get, provider):
+    """Test that a 400 response is treated as not found before raise_for_status."""
+    mock_get.return_value = UpstreamResponse(status_code=400)
+
+    # UpstreamResponse.raise_for_status raises for a 400, so reaching it
+    # would surface as APIRequestError instead of None
+    assert provider._make_request('search.json', {'q': 'zzzz'}) is None
+
+
+@patch('services.weatherapi_provider.requests.Session.get')
+def test_make_request_raises_on_server_error(mock_get, provider):
+    """Test that non-400 HTTP errors surface as APIRequestError."""
+    mock_get.return_value = UpstreamResponse(status_code=503)
+
+    with pytest.raises(APIRequestError):
+        provider._make_request('forecast.json', {'q': 'London'})
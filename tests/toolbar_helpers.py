@@ -0,0 +1,96 @@
+"""
+Shared helpers for the toolbar check scripts (toolbar_comprehensive_check.py
+and toolbar_functional_check.py), which report on the app served on
+localhost:5000. They print results rather than assert, so they are named
+outside pytest's test_*.py pattern and run directly.
+"""
+
+import functools
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE_URL = "http://localhost:5000"
+
+# One keep-alive session for the whole run, so every call to the app
+# reuses the same connection instead of opening a new one
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=0))
+
+
+def start_warmup():
+    """Send the server liveness request in the background; returns its future."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(SESSION.get, BASE_URL, timeout=5)
+    executor.shutdown(wait=False)
+    return future
+
+
+# Report buffer while a script's main() runs: lines are written to stdout
+# once per section instead of one write per print. Unset (pytest), p()
+# prints directly so the output is captured and shown with each test.
+_out = None
+
+
+def buffer_output():
+    """Collect p() output in a buffer until flush_output() writes it."""
+    global _out
+    _out = io.StringIO()
+
+
+def p(*args):
+    """print() into the report buffer, or to stdout when not buffering."""
+    print(*args, file=_out)
+
+
+def flush_output():
+    """Write the buffered report lines to stdout and empty the buffer."""
+    if _out is None:
+        return
+    sys.stdout.write(_out.getvalue())
+    sys.stdout.flush()
+    _out.seek(0)
+    _out.truncate()
+
+
+def fetch_all(calls, max_workers=8):
+    """Run independent request callables concurrently.
+
+    Returns their results in call order; a call that raised yields its
+    exception instead, for raise_if_failed to re-raise where it is reported.
+    """
+    def run(call):
+        try:
+            return call()
+        except Exception as e:
+            return e
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run, calls))
+
+
+def raise_if_failed(result):
+    """Return a fetch_all result, re-raising it if the call failed."""
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+def read_json(response):
+    """Decode a JSON response body with orjson, straight from the bytes."""
+    return orjson.loads(response.content)
+
+
+@functools.lru_cache(maxsize=256)
+def validate(location):
+    """GET /api/validate-location once per location per run."""
+    return SESSION.get(f"{BASE_URL}/api/validate-location", params={'location': location})
+
+
+@functools.lru_cache(maxsize=256)
+def search(query):
+    """GET /api/search-locations once per query per run."""
+    return SESSION.get(f"{BASE_URL}/api/search-locations", params={'q': query})